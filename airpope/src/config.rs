@@ -41,11 +41,9 @@ macro_rules! save_config_impl {
         let mut user_conf = $user_path.clone();
         user_conf.push(format!("{}.{}.tmconf", $prefix, $config.id));
 
-        let mut file = std::fs::File::create(user_conf).unwrap();
         let mut buffer = Vec::new();
         $config.encode(&mut buffer).unwrap();
-        file.write_all(&buffer).unwrap();
-        drop(file);
+        write_config_file(user_conf, &buffer);
     }};
 }
 
@@ -204,7 +202,14 @@ pub fn get_config(
     }
 }
 
-pub fn get_all_config(r#impl: &Implementations, user_path: Option<PathBuf>) -> Vec<ConfigImpl> {
+/// Lazily read every saved config for an implementation.
+///
+/// Each config file is only read and parsed when the iterator reaches it,
+/// so callers looking for a single config can stop early.
+pub fn iter_all_config(
+    r#impl: &Implementations,
+    user_path: Option<PathBuf>,
+) -> impl Iterator<Item = ConfigImpl> {
     let user_path = user_path.unwrap_or(get_user_path());
 
     if !user_path.exists() {
@@ -222,45 +227,35 @@ pub fn get_all_config(r#impl: &Implementations, user_path: Option<PathBuf>) -> V
     };
     glob_path.push(format!("{}.*.tmconf", prefix));
 
-    let mut matched_entries: Vec<ConfigImpl> = Vec::new();
-    for entry in glob::glob(glob_path.to_str().unwrap())
+    let reader: fn(PathBuf) -> Option<ConfigImpl> = match r#impl {
+        Implementations::Kmkc => |entry| read_kmkc_config(entry).map(ConfigImpl::Kmkc),
+        Implementations::Musq => |entry| read_musq_config(entry).map(ConfigImpl::Musq),
+        Implementations::Amap => |entry| read_amap_config(entry).map(ConfigImpl::Amap),
+        Implementations::Sjv => |entry| read_sjv_config(entry).map(ConfigImpl::Sjv),
+        Implementations::Rbean => |entry| read_rbean_config(entry).map(ConfigImpl::Rbean),
+    };
+
+    glob::glob(glob_path.to_str().unwrap())
         .expect("Failed to read glob pattern")
         .flatten()
-    {
-        match r#impl {
-            Implementations::Kmkc => {
-                let conf = read_kmkc_config(entry);
-                if let Some(conf) = conf {
-                    matched_entries.push(ConfigImpl::Kmkc(conf));
-                }
-            }
-            Implementations::Musq => {
-                let conf = read_musq_config(entry);
-                if let Some(conf) = conf {
-                    matched_entries.push(ConfigImpl::Musq(conf));
-                }
-            }
-            Implementations::Amap => {
-                let conf = read_amap_config(entry);
-                if let Some(conf) = conf {
-                    matched_entries.push(ConfigImpl::Amap(conf));
-                }
-            }
-            Implementations::Sjv => {
-                let conf = read_sjv_config(entry);
-                if let Some(conf) = conf {
-                    matched_entries.push(ConfigImpl::Sjv(conf));
-                }
-            }
-            Implementations::Rbean => {
-                let conf = read_rbean_config(entry);
-                if let Some(conf) = conf {
-                    matched_entries.push(ConfigImpl::Rbean(conf));
-                }
-            }
-        }
-    }
-    matched_entries
+        .filter_map(reader)
+}
+
+pub fn get_all_config(r#impl: &Implementations, user_path: Option<PathBuf>) -> Vec<ConfigImpl> {
+    iter_all_config(r#impl, user_path).collect()
+}
+
+/// Write the encoded config through a temporary file then rename it in place,
+/// so an interrupted save never leaves a truncated config behind.
+fn write_config_file(user_conf: PathBuf, buffer: &[u8]) {
+    let temp_conf = user_conf.with_extension("tmconf.tmp");
+
+    let mut file = std::fs::File::create(&temp_conf).unwrap();
+    file.write_all(buffer).unwrap();
+    file.sync_all().unwrap();
+    drop(file);
+
+    std::fs::rename(temp_conf, user_conf).unwrap();
 }
 
 pub fn save_config(config: ConfigImpl, user_path: Option<PathBuf>) {
@@ -283,7 +278,6 @@ pub fn save_config(config: ConfigImpl, user_path: Option<PathBuf>) {
                 conf_id,
             ));
 
-            let mut file = std::fs::File::create(user_conf).unwrap();
             let mut buffer = Vec::new();
 
             match config {
@@ -294,8 +288,7 @@ pub fn save_config(config: ConfigImpl, user_path: Option<PathBuf>) {
                     config.encode(&mut buffer).unwrap();
                 }
             }
-            file.write_all(&buffer).unwrap();
-            drop(file);
+            write_config_file(user_conf, &buffer);
         }
         ConfigImpl::Musq(config) => {
             save_config_impl!(crate::r#impl::musq::config::PREFIX, user_path, config)
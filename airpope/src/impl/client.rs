@@ -1,3 +1,5 @@
+use std::collections::HashMap;
+
 use crate::{
     config::{get_all_config, get_config},
     term::ConsoleChoice,
@@ -18,48 +20,7 @@ pub(crate) fn select_single_account(
         term.warn(&format!("Account ID {} not found!", account_id));
     }
 
-    let all_configs = get_all_config(&implementation, None);
-    let all_choices: Vec<ConsoleChoice> = all_configs
-        .iter()
-        .map(|c| match c {
-            crate::config::ConfigImpl::Amap(c) => ConsoleChoice {
-                name: c.id.clone(),
-                value: format!("{} - {} [{}]", c.id, c.email, c.r#type().to_name()),
-            },
-            crate::config::ConfigImpl::Kmkc(c) => match c {
-                super::kmkc::config::Config::Mobile(cc) => ConsoleChoice {
-                    name: cc.id.clone(),
-                    value: format!(
-                        "{} [{} - {}]",
-                        cc.id,
-                        cc.r#type().to_name(),
-                        cc.platform().to_name()
-                    ),
-                },
-                super::kmkc::config::Config::Web(cc) => ConsoleChoice {
-                    name: cc.id.clone(),
-                    value: format!("{} [{}]", cc.id, cc.r#type().to_name()),
-                },
-            },
-            crate::config::ConfigImpl::Musq(c) => ConsoleChoice {
-                name: c.id.clone(),
-                value: format!("{} [{}]", c.id, c.r#type().to_name()),
-            },
-            crate::config::ConfigImpl::Sjv(c) => ConsoleChoice {
-                name: c.id.clone(),
-                value: format!(
-                    "{} [{} - {}]",
-                    c.id,
-                    c.r#type().to_name(),
-                    c.mode().to_name()
-                ),
-            },
-            crate::config::ConfigImpl::Rbean(c) => ConsoleChoice {
-                name: c.id.clone(),
-                value: format!("{} [{} - {}]", c.id, c.email, c.platform().to_name()),
-            },
-        })
-        .collect();
+    let mut all_configs = get_all_config(&implementation, None);
 
     if all_configs.is_empty() {
         term.warn("No accounts found!");
@@ -68,30 +29,59 @@ pub(crate) fn select_single_account(
 
     // only 1? return
     if all_configs.len() == 1 {
-        return Some(all_configs[0].clone());
+        return all_configs.pop();
     }
 
-    let selected = term.choice("Select an account:", all_choices);
-    match selected {
-        Some(selected) => {
-            let config = all_configs
-                .iter()
-                .find(|&c| match c {
-                    crate::config::ConfigImpl::Amap(c) => c.id == selected.name,
-                    crate::config::ConfigImpl::Kmkc(c) => match c {
-                        super::kmkc::config::Config::Mobile(cc) => cc.id == selected.name,
-                        super::kmkc::config::Config::Web(cc) => cc.id == selected.name,
+    let mut by_id: HashMap<String, crate::config::ConfigImpl> =
+        HashMap::with_capacity(all_configs.len());
+    let all_choices: Vec<ConsoleChoice> = all_configs
+        .into_iter()
+        .map(|config| {
+            let choice = match &config {
+                crate::config::ConfigImpl::Amap(c) => ConsoleChoice {
+                    name: c.id.clone(),
+                    value: format!("{} - {} [{}]", c.id, c.email, c.r#type().to_name()),
+                },
+                crate::config::ConfigImpl::Kmkc(c) => match c {
+                    super::kmkc::config::Config::Mobile(cc) => ConsoleChoice {
+                        name: cc.id.clone(),
+                        value: format!(
+                            "{} [{} - {}]",
+                            cc.id,
+                            cc.r#type().to_name(),
+                            cc.platform().to_name()
+                        ),
+                    },
+                    super::kmkc::config::Config::Web(cc) => ConsoleChoice {
+                        name: cc.id.clone(),
+                        value: format!("{} [{}]", cc.id, cc.r#type().to_name()),
                     },
-                    crate::config::ConfigImpl::Musq(c) => c.id == selected.name,
-                    crate::config::ConfigImpl::Sjv(c) => c.id == selected.name,
-                    crate::config::ConfigImpl::Rbean(c) => c.id == selected.name,
-                })
-                .unwrap();
+                },
+                crate::config::ConfigImpl::Musq(c) => ConsoleChoice {
+                    name: c.id.clone(),
+                    value: format!("{} [{}]", c.id, c.r#type().to_name()),
+                },
+                crate::config::ConfigImpl::Sjv(c) => ConsoleChoice {
+                    name: c.id.clone(),
+                    value: format!(
+                        "{} [{} - {}]",
+                        c.id,
+                        c.r#type().to_name(),
+                        c.mode().to_name()
+                    ),
+                },
+                crate::config::ConfigImpl::Rbean(c) => ConsoleChoice {
+                    name: c.id.clone(),
+                    value: format!("{} [{} - {}]", c.id, c.email, c.platform().to_name()),
+                },
+            };
+            by_id.insert(choice.name.clone(), config);
+            choice
+        })
+        .collect();
 
-            Some(config.clone())
-        }
-        None => None,
-    }
+    let selected = term.choice("Select an account:", all_choices);
+    selected.and_then(|selected| by_id.remove(&selected.name))
 }
 
 pub(crate) fn make_musq_client(config: &super::musq::config::Config) -> airpope_musq::MUClient {
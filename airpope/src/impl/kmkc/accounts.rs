@@ -1,8 +1,7 @@
-use std::path::PathBuf;
+use std::{borrow::Cow, path::PathBuf};
 
 use clap::ValueEnum;
 use color_print::cformat;
-use num_format::{Locale, ToFormattedString};
 use airpope_kmkc::{KMClient, KMConfig, KMConfigMobile, KMConfigMobilePlatform};
 use airpope_macros::EnumName;
 
@@ -83,7 +82,6 @@ pub(crate) async fn kmkc_account_login_web(
 
     // parse netscape cookies
     let cookie_config = super::common::parse_netscape_cookies(cookies_path);
-    let all_configs = get_all_config(&crate::r#impl::Implementations::Kmkc, None);
 
     let client = make_kmkc_client(&KMConfig::Web(cookie_config.clone()));
 
@@ -92,6 +90,8 @@ pub(crate) async fn kmkc_account_login_web(
     match account {
         Ok(account) => {
             console.info(&cformat!("Authenticated as <m,s>{}</>", account.email));
+            // only needed to check for duplicates after a successful auth
+            let all_configs = get_all_config(&crate::r#impl::Implementations::Kmkc, None);
             let old_config = all_configs.iter().find(|&c| match c {
                 crate::config::ConfigImpl::Kmkc(super::config::Config::Web(cc)) => {
                     cc.account_id == account.id && cc.device_id == account.user_id
@@ -392,10 +392,13 @@ pub(crate) fn kmkc_accounts(console: &crate::term::Terminal) -> ExitCode {
             for (i, c) in all_configs.iter().enumerate() {
                 match c {
                     crate::config::ConfigImpl::Kmkc(c) => {
-                        let mut plat_name = c.get_type().to_name().to_string();
-                        if let Config::Mobile(mob) = &c {
-                            plat_name = format!("{} - {}", plat_name, mob.platform().to_name());
-                        }
+                        let plat_name: Cow<'static, str> = match c {
+                            Config::Mobile(mob) => {
+                                format!("{} - {}", c.get_type().to_name(), mob.platform().to_name())
+                                    .into()
+                            }
+                            Config::Web(_) => c.get_type().to_name().into(),
+                        };
                         console.info(&cformat!(
                             "{:02}. {} — <s>{}</> ({})",
                             i + 1,
@@ -427,30 +430,30 @@ pub(crate) async fn kmkc_account_info(
 
     match account {
         Ok(account) => {
-            console.info(&cformat!(
-                "Account info for <magenta,bold>{}</>:",
-                acc_info.get_id()
-            ));
-
-            console.info(&cformat!("  <s>ID:</>: {}", account.id));
-            console.info(&cformat!("  <s>User ID:</>: {}", account.user_id));
             let username = account.name.unwrap_or("Unknown".to_string());
-            console.info(&cformat!("  <s>Username:</>: {}", username));
-            console.info(&cformat!("  <s>Email:</>: {}", account.email));
-            console.info(&cformat!("  <s>Registered?</>: {}", account.registered));
+            let mut lines = vec![
+                cformat!("Account info for <magenta,bold>{}</>:", acc_info.get_id()),
+                cformat!("  <s>ID:</>: {}", account.id),
+                cformat!("  <s>User ID:</>: {}", account.user_id),
+                cformat!("  <s>Username:</>: {}", username),
+                cformat!("  <s>Email:</>: {}", account.email),
+                cformat!("  <s>Registered?</>: {}", account.registered),
+            ];
 
             if !account.devices.is_empty() {
-                console.info(&cformat!("  <s>Devices:</>"));
-                for device in account.devices {
-                    console.info(&cformat!(
+                lines.push(cformat!("  <s>Devices:</>"));
+                lines.extend(account.devices.iter().map(|device| {
+                    cformat!(
                         "    - <s>{}</>: {} [{}]",
                         device.id,
                         device.name,
                         device.platform.to_name()
-                    ));
-                }
+                    )
+                }));
             }
 
+            console.info_lines(&lines);
+
             0
         }
         Err(err) => {
@@ -477,27 +480,7 @@ pub(crate) async fn kmkc_balance(
             1
         }
         Ok(balance) => {
-            console.info("Your current point balance:");
-            let total_bal = balance.point.total_point().to_formatted_string(&Locale::en);
-            let paid_point = balance.point.paid_point.to_formatted_string(&Locale::en);
-            let free_point = balance.point.free_point.to_formatted_string(&Locale::en);
-            let premium_ticket = balance.ticket.total_num.to_formatted_string(&Locale::en);
-            console.info(&cformat!(
-                "  - <bold>Total:</> <cyan!,bold><reverse>{}</>c</cyan!,bold>",
-                total_bal
-            ));
-            console.info(&cformat!(
-                "  - <bold>Paid point:</> <g,bold><reverse>{}</>c</g,bold>",
-                paid_point
-            ));
-            console.info(&cformat!(
-                "  - <bold>Free point:</> <cyan,bold><reverse>{}</>c</cyan,bold>",
-                free_point
-            ));
-            console.info(&cformat!(
-                "  - <bold>Premium ticket:</> <yellow,bold><reverse>{}</> ticket</yellow,bold>",
-                premium_ticket
-            ));
+            console.info_lines(&super::common::format_point_balance(&balance));
 
             0
         }
@@ -0,0 +1,108 @@
+use std::path::{Path, PathBuf};
+
+use airpope_kmkc::{models::TitleNode, KMClient};
+use serde::{Deserialize, Serialize};
+
+use super::config::Config;
+
+const TITLE_CACHE_TTL: i64 = 60 * 5; // 5 minutes in seconds
+const TITLE_CACHE_PREFIX: &str = "kmkc_titles_";
+
+#[derive(Serialize, Deserialize)]
+struct TitleCache {
+    cached_at: i64,
+    title_ids: Vec<i32>,
+    titles: Vec<TitleNode>,
+}
+
+fn title_cache_dir() -> PathBuf {
+    crate::config::get_user_path().join("cache")
+}
+
+/// One file per account and cache key, [`TitleNode`] has per-user fields (e.g. favorite).
+fn title_cache_path(account: &Config, cache_key: &str) -> PathBuf {
+    title_cache_dir().join(format!(
+        "{}{}_{}.json",
+        TITLE_CACHE_PREFIX,
+        account.get_id(),
+        cache_key
+    ))
+}
+
+async fn read_title_cache(cache_path: &Path, title_ids: &[i32]) -> Option<Vec<TitleNode>> {
+    let content = tokio::fs::read(cache_path).await.ok()?;
+    let cache: TitleCache = serde_json::from_slice(&content).ok()?;
+
+    let is_fresh = cache.cached_at + TITLE_CACHE_TTL > chrono::Utc::now().timestamp();
+    if is_fresh && cache.title_ids == title_ids {
+        Some(cache.titles)
+    } else {
+        None
+    }
+}
+
+async fn write_title_cache(
+    cache_path: &Path,
+    title_ids: &[i32],
+    titles: &[TitleNode],
+) -> anyhow::Result<()> {
+    if let Some(parent) = cache_path.parent() {
+        tokio::fs::create_dir_all(parent).await?;
+    }
+
+    let cache = TitleCache {
+        cached_at: chrono::Utc::now().timestamp(),
+        title_ids: title_ids.to_vec(),
+        titles: titles.to_vec(),
+    };
+    tokio::fs::write(cache_path, serde_json::to_vec(&cache)?).await?;
+
+    Ok(())
+}
+
+/// Remove expired title cache files, so the cache folder does not keep growing.
+async fn prune_title_cache() -> anyhow::Result<()> {
+    let ttl = std::time::Duration::from_secs(TITLE_CACHE_TTL as u64);
+    let mut entries = tokio::fs::read_dir(title_cache_dir()).await?;
+
+    while let Some(entry) = entries.next_entry().await? {
+        let file_name = entry.file_name();
+        if !file_name.to_string_lossy().starts_with(TITLE_CACHE_PREFIX) {
+            continue;
+        }
+
+        let modified = entry.metadata().await?.modified()?;
+        if modified.elapsed().is_ok_and(|age| age > ttl) {
+            tokio::fs::remove_file(entry.path()).await?;
+        }
+    }
+
+    Ok(())
+}
+
+/// Get the title list, reusing a recent response from the disk cache if possible.
+///
+/// The `cache_key` identify what the list is for (e.g. a ranking tab), the cache is
+/// only used if it has the same `title_ids` in the same order.
+///
+/// Only meant for display purpose (e.g. rankings), anything that depends on
+/// the latest episode list should use [`KMClient::get_titles`] directly.
+pub(super) async fn get_titles_cached(
+    client: &KMClient,
+    account: &Config,
+    cache_key: &str,
+    title_ids: Vec<i32>,
+) -> anyhow::Result<Vec<TitleNode>> {
+    let cache_path = title_cache_path(account, cache_key);
+
+    if let Some(titles) = read_title_cache(&cache_path, &title_ids).await {
+        return Ok(titles);
+    }
+
+    let titles = client.get_titles(title_ids.clone()).await?;
+    // the cache is best-effort, a failed write should not fail the command
+    let _ = prune_title_cache().await;
+    let _ = write_title_cache(&cache_path, &title_ids, &titles).await;
+
+    Ok(titles)
+}
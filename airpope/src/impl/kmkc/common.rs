@@ -1,10 +1,11 @@
-use std::path::PathBuf;
+use std::{collections::HashMap, path::PathBuf};
 
 use color_print::cformat;
+use futures::{StreamExt, TryStreamExt};
 use num_format::{Locale, ToFormattedString};
 use airpope_kmkc::{
     constants::BASE_HOST,
-    models::{TitleNode, TitleTicketListNode, UserPointResponse},
+    models::{EpisodeNode, TitleNode, TitleTicketListNode, UserPointResponse},
     KMClient, KMConfigWeb,
 };
 
@@ -71,6 +72,49 @@ pub(super) fn parse_netscape_cookies(cookie_path: PathBuf) -> KMConfigWeb {
     config
 }
 
+/// Format the point balance of a user into printable lines.
+pub(super) fn format_point_balance(balance: &UserPointResponse) -> Vec<String> {
+    vec![
+        "Your current point balance:".to_string(),
+        cformat!(
+            "  - <bold>Total:</> <cyan!,bold><reverse>{}</>c</cyan!,bold>",
+            balance.point.total_point().to_formatted_string(&Locale::en)
+        ),
+        cformat!(
+            "  - <bold>Paid point:</> <g,bold><reverse>{}</>c</g,bold>",
+            balance.point.paid_point.to_formatted_string(&Locale::en)
+        ),
+        cformat!(
+            "  - <bold>Free point:</> <cyan,bold><reverse>{}</>c</cyan,bold>",
+            balance.point.free_point.to_formatted_string(&Locale::en)
+        ),
+        cformat!(
+            "  - <bold>Premium ticket:</> <yellow,bold><reverse>{}</> ticket</yellow,bold>",
+            balance.ticket.total_num.to_formatted_string(&Locale::en)
+        ),
+    ]
+}
+
+/// How many episode chunks are requested at the same time.
+const EPISODE_FETCH_CONCURRENCY: usize = 4;
+
+/// Fetch all the episodes in chunks of 50, with a few chunks requested at once.
+///
+/// The returned episodes keep the same order as `episode_ids`.
+pub(super) async fn fetch_episodes(
+    client: &KMClient,
+    episode_ids: &[i32],
+) -> anyhow::Result<Vec<EpisodeNode>> {
+    // `buffered` keeps the results in the original order
+    let chapters: Vec<Vec<EpisodeNode>> = futures::stream::iter(episode_ids.chunks(50))
+        .map(|episodes| client.get_episodes(episodes.to_vec()))
+        .buffered(EPISODE_FETCH_CONCURRENCY)
+        .try_collect()
+        .await?;
+
+    Ok(chapters.into_iter().flatten().collect())
+}
+
 #[derive(Clone)]
 pub(super) struct PurchasePoint {
     pub(super) point: UserPointResponse,
@@ -95,18 +139,23 @@ pub(super) async fn common_purchase_select(
         "Getting user point for <m,s>{}</>...",
         account.get_username()
     ));
-    let user_point = client.get_user_point().await;
+    console.info(&cformat!(
+        "Getting title information and ticket for ID <m,s>{}</>...",
+        title_id
+    ));
+    // None of these depend on each other, so request them all at once.
+    let (user_point, results, ticket_entry) = tokio::join!(
+        client.get_user_point(),
+        client.get_titles(vec![title_id]),
+        client.get_title_ticket(title_id)
+    );
+
     if let Err(error) = user_point {
         console.error(&format!("Unable to get user point: {}", error));
         return (Err(error), None, vec![], None);
     }
     let user_point = user_point.unwrap();
 
-    console.info(&cformat!(
-        "Getting title information for ID <m,s>{}</>...",
-        title_id
-    ));
-    let results = client.get_titles(vec![title_id]).await;
     if let Err(error) = results {
         console.error(&format!("Failed to get title information: {}", error));
         return (Err(error), None, vec![], None);
@@ -125,11 +174,6 @@ pub(super) async fn common_purchase_select(
 
     let result = results.first().unwrap();
 
-    console.info(&cformat!(
-        "Fetching <m,s>{}</> title ticket...",
-        result.title
-    ));
-    let ticket_entry = client.get_title_ticket(result.id).await;
     if let Err(error) = ticket_entry {
         console.error(&format!("Failed to get title ticket: {}", error));
         return (Err(error), Some(result.clone()), vec![], None);
@@ -137,55 +181,29 @@ pub(super) async fn common_purchase_select(
 
     let ticket_entry = ticket_entry.unwrap();
 
-    let mut chapters_entry = vec![];
     console.info(&cformat!("Fetching <m,s>{}</> chapters...", result.title));
-    for episodes in result.episode_ids.clone().chunks(50) {
-        let chapters = client.get_episodes(episodes.to_vec()).await;
-
-        if let Err(error) = chapters {
+    let chapters_entry = match fetch_episodes(client, &result.episode_ids).await {
+        Ok(chapters) => chapters,
+        Err(error) => {
             console.error(&format!("Failed to get chapters: {}", error));
             return (
                 Err(error),
                 Some(result.clone()),
-                chapters_entry,
+                vec![],
                 Some(PurchasePoint {
                     point: user_point,
                     ticket: ticket_entry,
                 }),
             );
         }
+    };
 
-        chapters_entry.extend(chapters.unwrap());
-    }
-
-    console.info("Your current point balance:");
-    let total_bal = user_point
-        .point
-        .total_point()
-        .to_formatted_string(&Locale::en);
-    let paid_point = user_point.point.paid_point.to_formatted_string(&Locale::en);
-    let free_point = user_point.point.free_point.to_formatted_string(&Locale::en);
-    let premium_ticket = user_point.ticket.total_num.to_formatted_string(&Locale::en);
-    console.info(&cformat!(
-        "  - <bold>Total:</> <cyan!,bold><reverse>{}</>c</cyan!,bold>",
-        total_bal
-    ));
-    console.info(&cformat!(
-        "  - <bold>Paid point:</> <g,bold><reverse>{}</>c</g,bold>",
-        paid_point
-    ));
-    console.info(&cformat!(
-        "  - <bold>Free point:</> <cyan,bold><reverse>{}</>c</cyan,bold>",
-        free_point
-    ));
-    console.info(&cformat!(
-        "  - <bold>Premium ticket:</> <yellow,bold><reverse>{}</> ticket</yellow,bold>",
-        premium_ticket
-    ));
-    console.info(&cformat!(
+    let mut balance_lines = format_point_balance(&user_point);
+    balance_lines.push(cformat!(
         "  - <bold>Title ticket?</bold>: {}",
         ticket_entry.is_title_available()
     ));
+    console.info_lines(&balance_lines);
 
     console.info("Title information:");
     console.info(&cformat!("  - <bold>ID:</> {}", result.id));
@@ -210,15 +228,15 @@ pub(super) async fn common_purchase_select(
     let select_choices: Vec<ConsoleChoice> = chapters_entry
         .iter()
         .filter_map(|ch| {
-            if download_mode && !show_all && !ch.is_available() {
+            let available = ch.is_available();
+            if download_mode && !show_all && !available {
                 None
             } else {
-                let value = if ch.is_available() {
+                let value = if available {
                     ch.title.clone()
-                } else if ch.is_ticketable() {
-                    format!("{} ({}P/Ticket)", ch.title, ch.point)
                 } else {
-                    format!("{} ({}P)", ch.title, ch.point)
+                    let suffix = if ch.is_ticketable() { "P/Ticket" } else { "P" };
+                    format!("{} ({}{})", ch.title, ch.point, suffix)
                 };
                 Some(ConsoleChoice {
                     name: ch.id.to_string(),
@@ -237,17 +255,13 @@ pub(super) async fn common_purchase_select(
     let selected_chapters = console.select(sel_prompt, select_choices);
     match selected_chapters {
         Some(selected) => {
+            let chapters_by_id: HashMap<i32, &airpope_kmkc::models::EpisodeNode> =
+                chapters_entry.iter().map(|ch| (ch.id, ch)).collect();
             let mapped_chapters: Vec<airpope_kmkc::models::EpisodeNode> = selected
                 .iter()
                 .map(|ch| {
                     let ch_id = ch.name.parse::<i32>().unwrap();
-                    let ch = chapters_entry
-                        .iter()
-                        .find(|ch| ch.id == ch_id)
-                        .unwrap()
-                        .clone();
-
-                    ch
+                    (*chapters_by_id.get(&ch_id).unwrap()).clone()
                 })
                 .collect();
 
@@ -1,7 +1,9 @@
+use std::collections::HashSet;
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
 use color_print::cformat;
+use airpope_kmkc::imaging::{CompressionType, Descrambler};
 use airpope_kmkc::models::ImagePageNode;
 use airpope_kmkc::{
     models::{EpisodeNode, EpisodeViewerResponse, TicketInfoType, TitleNode},
@@ -16,6 +18,9 @@ use crate::{
 
 use super::{common::common_purchase_select, config::Config};
 
+/// Maximum number of images fetched at the same time in parallel mode.
+const PARALLEL_DOWNLOAD_LIMIT: usize = 8;
+
 #[derive(Clone, Debug, Default)]
 pub(crate) struct KMDownloadCliConfig {
     /// Disable all input prompt (a.k.a `autodownload`)
@@ -28,6 +33,8 @@ pub(crate) struct KMDownloadCliConfig {
 
     /// Parallel download
     pub(crate) parallel: bool,
+    /// Use faster PNG compression for descrambled images
+    pub(crate) fast_png: bool,
 
     /// The start chapter range.
     ///
@@ -42,35 +49,51 @@ pub(crate) struct KMDownloadCliConfig {
     pub(crate) no_point: bool,
 }
 
-fn check_downloaded_image_count(image_dir: &PathBuf, extension: &str) -> Option<usize> {
-    // check if dir exist
-    if !image_dir.exists() {
-        return None;
-    }
+/// Check if the image directory already has at least `expected` files with the extension.
+///
+/// Stops reading the directory as soon as enough images are found.
+fn has_downloaded_images(image_dir: &Path, extension: &str, expected: usize) -> bool {
+    let entries = match std::fs::read_dir(image_dir) {
+        Ok(entries) => entries,
+        Err(_) => return false,
+    };
 
-    // check if dir is dir
-    if !image_dir.is_dir() {
-        return None;
-    }
-
-    // check how many .avif files in the dir
     let mut count = 0;
-    for entry in std::fs::read_dir(image_dir).unwrap() {
-        let entry = entry.unwrap();
-        let path = entry.path();
-        if path.is_file() && path.extension().unwrap() == extension {
+    for entry in entries.flatten() {
+        let is_file = entry.file_type().map(|ft| ft.is_file()).unwrap_or(false);
+        if is_file && entry.path().extension().is_some_and(|ext| ext == extension) {
             count += 1;
+            if count >= expected {
+                return true;
+            }
         }
     }
 
-    Some(count)
+    false
+}
+
+/// Marker file written in a chapter folder once every page has been downloaded.
+///
+/// Store `{extension}:{page_count}` so later runs can tell if the chapter is complete
+/// without asking the API for the viewer information again.
+const PAGES_MARKER: &str = ".pages";
+
+fn read_pages_marker(image_dir: &Path) -> Option<(String, usize)> {
+    let content = std::fs::read_to_string(image_dir.join(PAGES_MARKER)).ok()?;
+    let (extension, count) = content.trim().split_once(':')?;
+    Some((extension.to_string(), count.parse().ok()?))
+}
+
+fn write_pages_marker(image_dir: &Path, extension: &str, count: usize) -> std::io::Result<()> {
+    std::fs::write(
+        image_dir.join(PAGES_MARKER),
+        format!("{}:{}", extension, count),
+    )
 }
 
 fn create_chapters_info(title: &TitleNode, chapters: Vec<EpisodeNode>) -> MangaDetailDump {
-    let mut dumped_chapters: Vec<ChapterDetailDump> = vec![];
-    for chapter in chapters {
-        dumped_chapters.push(ChapterDetailDump::from(chapter));
-    }
+    let dumped_chapters: Vec<ChapterDetailDump> =
+        chapters.into_iter().map(ChapterDetailDump::from).collect();
 
     MangaDetailDump::new(title.title.clone(), title.author.clone(), dumped_chapters)
 }
@@ -100,7 +123,8 @@ struct KMKCDownloadNode {
     image: ImagePageNode,
     idx: usize,
     extension: String,
-    seed: Option<u32>,
+    descrambler: Option<Arc<Descrambler>>,
+    compression: CompressionType,
 }
 
 async fn kmkc_actual_downloader(
@@ -124,7 +148,12 @@ async fn kmkc_actual_downloader(
 
     match node
         .client
-        .stream_download(&node.image.url, node.seed, writer)
+        .stream_download_with_compression(
+            &node.image.url,
+            node.descrambler,
+            node.compression,
+            writer,
+        )
         .await
     {
         Ok(_) => {}
@@ -168,6 +197,7 @@ pub(crate) async fn kmkc_download(
 
     match (results, title_detail, user_point) {
         (Ok(results), Some(title_detail), Some(user_point)) => {
+            let selected_ids: HashSet<usize> = dl_config.chapter_ids.iter().copied().collect();
             let results: Vec<&EpisodeNode> = results
                 .iter()
                 .filter(|&ch| {
@@ -187,8 +217,7 @@ pub(crate) async fn kmkc_download(
                             _ => true,
                         }
                     } else {
-                        dl_config.chapter_ids.is_empty()
-                            || dl_config.chapter_ids.contains(&(ch.id as usize))
+                        selected_ids.is_empty() || selected_ids.contains(&(ch.id as usize))
                     }
                 })
                 .collect();
@@ -198,8 +227,9 @@ pub(crate) async fn kmkc_download(
                 return 1;
             }
 
-            let mut wallet_copy = user_point.point.point.clone();
-            let mut ticket_entry = user_point.ticket.clone();
+            // we own the purchase point here, so just move it out instead of cloning
+            let mut wallet_copy = user_point.point.point;
+            let mut ticket_entry = user_point.ticket;
             console.info(&format!("Downloading {} chapters...", results.len()));
             let mut download_chapters = vec![];
             // let mut chapters_with_bonus = vec![];
@@ -308,7 +338,7 @@ pub(crate) async fn kmkc_download(
                 return 1;
             }
 
-            download_chapters.sort_by(|&a, &b| a.id.cmp(&b.id));
+            download_chapters.sort_unstable_by_key(|ch| ch.id);
 
             let title_dir = get_output_directory(&output_dir, title_id, None, true);
             let dump_info = create_chapters_info(&title_detail, all_chapters);
@@ -325,6 +355,21 @@ pub(crate) async fn kmkc_download(
                     chapter.id
                 ));
 
+                // title_dir is already created above, only the chapter folder is left
+                let image_dir = title_dir.join(chapter.id.to_string());
+
+                // skip the viewer request entirely if a previous run finished this chapter
+                if let Some((extension, count)) = read_pages_marker(&image_dir) {
+                    if has_downloaded_images(&image_dir, &extension, count) {
+                        console.warn(&cformat!(
+                            "   Chapter <m,s>{}</> (<s>{}</>) already downloaded, skipping",
+                            chapter.title,
+                            chapter.id
+                        ));
+                        continue;
+                    }
+                }
+
                 let viewer_info = client.get_episode_viewer(chapter).await;
 
                 if let Err(e) = viewer_info {
@@ -333,8 +378,6 @@ pub(crate) async fn kmkc_download(
                 }
 
                 let viewer_info = viewer_info.unwrap();
-                let image_dir =
-                    get_output_directory(&output_dir, title_id, Some(chapter.id), false);
 
                 // precheck
                 match &viewer_info {
@@ -348,15 +391,13 @@ pub(crate) async fn kmkc_download(
                             continue;
                         }
 
-                        if let Some(count) = check_downloaded_image_count(&image_dir, "png") {
-                            if count >= web.pages.len() {
-                                console.warn(&cformat!(
-                                    "   Chapter <m,s>{}</> (<s>{}</>) already downloaded, skipping",
-                                    chapter.title,
-                                    chapter.id
-                                ));
-                                continue;
-                            }
+                        if has_downloaded_images(&image_dir, "png", web.pages.len()) {
+                            console.warn(&cformat!(
+                                "   Chapter <m,s>{}</> (<s>{}</>) already downloaded, skipping",
+                                chapter.title,
+                                chapter.id
+                            ));
+                            continue;
                         }
 
                         if console.is_debug() {
@@ -373,15 +414,13 @@ pub(crate) async fn kmkc_download(
                             continue;
                         }
 
-                        if let Some(count) = check_downloaded_image_count(&image_dir, "jpg") {
-                            if count >= mobile.pages.len() {
-                                console.warn(&cformat!(
-                                    "   Chapter <m,s>{}</> (<s>{}</>) already downloaded, skipping",
-                                    chapter.title,
-                                    chapter.id
-                                ));
-                                continue;
-                            }
+                        if has_downloaded_images(&image_dir, "jpg", mobile.pages.len()) {
+                            console.warn(&cformat!(
+                                "   Chapter <m,s>{}</> (<s>{}</>) already downloaded, skipping",
+                                chapter.title,
+                                chapter.id
+                            ));
+                            continue;
                         }
                     }
                 };
@@ -397,30 +436,31 @@ pub(crate) async fn kmkc_download(
                             .collect::<Vec<airpope_kmkc::models::ImagePageNode>>()
                     }
                 };
-                let scramble_seed = match &viewer_info {
+                // every page share the same seed, build the block layout once per chapter
+                let descrambler = match &viewer_info {
                     EpisodeViewerResponse::Mobile(_) => None,
-                    EpisodeViewerResponse::Web(web) => Some(web.scramble_seed),
+                    EpisodeViewerResponse::Web(web) => {
+                        Some(Arc::new(Descrambler::new(4, web.scramble_seed)))
+                    }
                 };
                 let force_extensions = match &viewer_info {
                     EpisodeViewerResponse::Mobile(_) => "jpg",
                     EpisodeViewerResponse::Web(_) => "png",
                 };
 
+                let compression = if dl_config.fast_png {
+                    CompressionType::Fast
+                } else {
+                    CompressionType::Best
+                };
                 let total_image_count = image_blocks.len() as u64;
 
-                let progress = Arc::new(indicatif::ProgressBar::new(total_image_count));
-                progress.enable_steady_tick(std::time::Duration::from_millis(120));
-                progress.set_style(
-                    indicatif::ProgressStyle::with_template(
-                        "{spinner:.blue} {msg} [{elapsed_precise}] [{wide_bar:.cyan/blue}] {pos}/{len}",
-                    )
-                    .unwrap()
-                    .progress_chars("#>-")
-                    .tick_strings(&["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏", " "]),
+                let progress = Arc::new(
+                    console.make_progress(total_image_count, Some("Downloading".to_string())),
                 );
-                progress.set_message("Downloading");
 
                 if dl_config.parallel {
+                    let semaphore = Arc::new(tokio::sync::Semaphore::new(PARALLEL_DOWNLOAD_LIMIT));
                     let tasks: Vec<_> = image_blocks
                         .iter()
                         .enumerate()
@@ -431,15 +471,20 @@ pub(crate) async fn kmkc_download(
                             let cnsl = console.clone();
                             let image = image.clone();
                             let progress = Arc::clone(&progress);
+                            let semaphore = Arc::clone(&semaphore);
+                            let descrambler = descrambler.clone();
 
                             tokio::spawn(async move {
+                                // hold a permit for the whole download so we don't flood the CDN
+                                let _permit = semaphore.acquire_owned().await.unwrap();
                                 match kmkc_actual_downloader(
                                     KMKCDownloadNode {
                                         client: wrap_client,
                                         image,
                                         idx,
                                         extension: force_extensions.to_string(),
-                                        seed: scramble_seed,
+                                        descrambler,
+                                        compression,
                                     },
                                     image_dir,
                                     cnsl.clone(),
@@ -465,7 +510,8 @@ pub(crate) async fn kmkc_download(
                                 image: image.clone(),
                                 idx,
                                 extension: force_extensions.to_string(),
-                                seed: scramble_seed,
+                                descrambler: descrambler.clone(),
+                                compression,
                             },
                             image_dir.clone(),
                             console.clone(),
@@ -482,6 +528,14 @@ pub(crate) async fn kmkc_download(
                 }
 
                 progress.finish_with_message("Downloaded");
+
+                if has_downloaded_images(&image_dir, force_extensions, image_blocks.len()) {
+                    if let Err(e) =
+                        write_pages_marker(&image_dir, force_extensions, image_blocks.len())
+                    {
+                        console.warn(&format!("   Failed to write pages marker: {}", e));
+                    }
+                }
             }
 
             0
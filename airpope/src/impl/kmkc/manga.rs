@@ -1,3 +1,5 @@
+use std::collections::HashMap;
+
 use color_print::cformat;
 use airpope_kmkc::{
     constants::BASE_HOST,
@@ -8,7 +10,7 @@ use airpope_kmkc::{
 use super::super::parser::WeeklyCodeCli;
 use crate::{cli::ExitCode, linkify};
 
-use super::common::do_print_search_information;
+use super::common::{do_print_search_information, fetch_episodes};
 
 pub(crate) async fn kmkc_search(
     query: &str,
@@ -105,18 +107,17 @@ fn format_tag_name(tag_name: String) -> String {
     tag_name
 }
 
-fn format_tags(tags: Vec<GenreNode>) -> String {
-    let parsed_tags = tags
+fn format_tags(genre_ids: &[i32], genres: Vec<GenreNode>) -> String {
+    let genre_map: HashMap<i32, String> = genres.into_iter().map(|g| (g.id, g.name)).collect();
+
+    genre_ids
         .iter()
-        .map(|tag| {
-            cformat!(
-                "<p(244),reverse,bold>{}</>",
-                format_tag_name(tag.clone().name)
-            )
+        .map(|genre_id| match genre_map.get(genre_id) {
+            Some(name) => cformat!("<p(244),reverse,bold>{}</>", format_tag_name(name.clone())),
+            None => cformat!("<r,reverse,bold>Unknown ({})</>", genre_id),
         })
         .collect::<Vec<String>>()
-        .join(", ");
-    parsed_tags
+        .join(", ")
 }
 
 pub(crate) async fn kmkc_title_info(
@@ -165,17 +166,13 @@ pub(crate) async fn kmkc_title_info(
                     result.episode_ids.len()
                 ));
 
-                for chunk_eps in result.episode_ids.chunks(50) {
-                    let chap_req = client.get_episodes(chunk_eps.to_vec()).await;
-
-                    match chap_req {
-                        Err(e) => {
-                            console.error(&cformat!("Failed to get chapter information: {}", e));
-                            return 1;
-                        }
-                        Ok(chap_req) => {
-                            chapters_info.extend(chap_req);
-                        }
+                match fetch_episodes(client, &result.episode_ids).await {
+                    Err(e) => {
+                        console.error(&cformat!("Failed to get chapter information: {}", e));
+                        return 1;
+                    }
+                    Ok(chap_req) => {
+                        chapters_info = chap_req;
                     }
                 }
             }
@@ -192,7 +189,7 @@ pub(crate) async fn kmkc_title_info(
             if !genre_results.is_empty() {
                 console.info(&cformat!(
                     "  <s>Genre/Tags</>: {}",
-                    format_tags(genre_results)
+                    format_tags(&result.genre_ids, genre_results)
                 ));
             }
             if result.magazine != MagazineCategory::Undefined {
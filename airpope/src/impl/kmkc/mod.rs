@@ -7,6 +7,7 @@ use super::parser::{parse_comma_number, CommaSeparatedNumber, WeeklyCodeCli};
 use self::rankings::RankingType;
 
 pub(crate) mod accounts;
+mod cache;
 pub(super) mod common;
 pub(crate) mod config;
 pub(crate) mod download;
@@ -84,6 +85,9 @@ pub(crate) enum KMKCCommands {
         /// Enable parallel download
         #[arg(short = 'p', long = "parallel")]
         parallel: bool,
+        /// Use faster PNG compression for descrambled images (bigger files)
+        #[arg(long = "fast-png")]
+        fast_png: bool,
     },
     /// Get your account point balance
     Balance,
@@ -106,6 +110,9 @@ pub(crate) enum KMKCCommands {
         /// Enable parallel download
         #[arg(short = 'x', long = "parallel")]
         parallel: bool,
+        /// Use faster PNG compression for descrambled images (bigger files)
+        #[arg(long = "fast-png")]
+        fast_png: bool,
     },
     /// Get your account favorites list
     Favorites,
@@ -8,7 +8,10 @@ use airpope_kmkc::{
 
 use crate::{cli::ExitCode, linkify};
 
-use super::{common::common_purchase_select, config::Config};
+use super::{
+    common::{common_purchase_select, format_point_balance},
+    config::Config,
+};
 
 pub(crate) async fn kmkc_purchase(
     title_id: i32,
@@ -26,7 +29,7 @@ pub(crate) async fn kmkc_purchase(
             }
 
             let mut wallet_copy = user_point.point.point.clone();
-            let mut ticket_entry = user_point.ticket.clone();
+            let mut ticket_entry = user_point.ticket;
 
             let mut chapter_point_claim: Vec<EpisodeNode> = vec![];
             let mut ticketing_claim: Vec<(EpisodeNode, TicketInfoType)> = vec![];
@@ -75,15 +78,17 @@ pub(crate) async fn kmkc_purchase(
                 return 1;
             }
 
-            console.info("Precalculate purchase information...");
-            console.info(&cformat!(
-                "  - <bold>With point:</> {} chapters",
-                chapter_point_claim.len()
-            ));
-            console.info(&cformat!(
-                "  - <bold>With ticket:</> {} chapters",
-                ticketing_claim.len()
-            ));
+            console.info_lines(&[
+                "Precalculate purchase information...".to_string(),
+                cformat!(
+                    "  - <bold>With point:</> {} chapters",
+                    chapter_point_claim.len()
+                ),
+                cformat!(
+                    "  - <bold>With ticket:</> {} chapters",
+                    ticketing_claim.len()
+                ),
+            ]);
 
             console.status(format!("Purchasing chapter(s)... (1/{})", total_claim));
             let mut purchase_count = 0;
@@ -116,7 +121,8 @@ pub(crate) async fn kmkc_purchase(
                 let temp_chapter_claim: Vec<&EpisodeNode> =
                     chapter_point_claim.iter().collect::<Vec<&EpisodeNode>>();
 
-                let mut mutable_point = user_point.point.point.clone();
+                // the precalculated wallet is a copy, so the original can be moved here
+                let mut mutable_point = user_point.point.point;
 
                 let result = client
                     .claim_episodes(temp_chapter_claim, &mut mutable_point)
@@ -252,7 +258,7 @@ pub(crate) async fn kmkc_purchase_precalculate(
             }
 
             let mut wallet_copy = user_point.point.point.clone();
-            let mut ticket_entry = user_point.ticket.clone();
+            let mut ticket_entry = user_point.ticket;
 
             let mut chapter_point_claim: Vec<EpisodeNode> = vec![];
             let mut ticketing_claim: Vec<(EpisodeNode, TicketInfoType)> = vec![];
@@ -288,47 +294,12 @@ pub(crate) async fn kmkc_purchase_precalculate(
                 return 1;
             }
 
-            console.info("Your current point balance:");
-            let total_bal = user_point
-                .point
-                .point
-                .total_point()
-                .to_formatted_string(&Locale::en);
-            let paid_point = user_point
-                .point
-                .point
-                .paid_point
-                .to_formatted_string(&Locale::en);
-            let free_point = user_point
-                .point
-                .point
-                .free_point
-                .to_formatted_string(&Locale::en);
-            let premium_ticket = user_point
-                .point
-                .ticket
-                .total_num
-                .to_formatted_string(&Locale::en);
-            console.info(&cformat!(
-                "  - <bold>Total:</> <cyan!,bold><reverse>{}</>c</cyan!,bold>",
-                total_bal
-            ));
-            console.info(&cformat!(
-                "  - <bold>Paid point:</> <g,bold><reverse>{}</>c</g,bold>",
-                paid_point
-            ));
-            console.info(&cformat!(
-                "  - <bold>Free point:</> <cyan,bold><reverse>{}</>c</cyan,bold>",
-                free_point
-            ));
-            console.info(&cformat!(
-                "  - <bold>Premium ticket:</> <yellow,bold><reverse>{}</> ticket</yellow,bold>",
-                premium_ticket
-            ));
-            console.info(&cformat!(
+            let mut balance_lines = format_point_balance(&user_point.point);
+            balance_lines.push(cformat!(
                 "  - <bold>Title ticket?</bold>: {}",
                 ticket_entry.is_title_available()
             ));
+            console.info_lines(&balance_lines);
 
             let coin_total = chapter_point_claim
                 .iter()
@@ -343,14 +314,16 @@ pub(crate) async fn kmkc_purchase_precalculate(
                 .count()
                 > 0;
 
-            console.info("Precalculated purchase cost:");
-            console.info(&cformat!("  - <bold>Total</>: {}", total_claim));
-            console.info(&cformat!("  - <bold>Coins</>: {}c", coin_total));
-            console.info(&cformat!("  - <bold>Ticket</>: {}c", ticket_total));
-
+            let mut cost_lines = vec![
+                "Precalculated purchase cost:".to_string(),
+                cformat!("  - <bold>Total</>: {}", total_claim),
+                cformat!("  - <bold>Coins</>: {}c", coin_total),
+                cformat!("  - <bold>Ticket</>: {}c", ticket_total),
+            ];
             if use_title_ticket {
-                console.info("     Will also use title ticket!")
+                cost_lines.push("     Will also use title ticket!".to_string());
             }
+            console.info_lines(&cost_lines);
 
             0
         }
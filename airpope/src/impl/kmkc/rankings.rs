@@ -7,7 +7,7 @@ use airpope_kmkc::{
 
 use crate::cli::ExitCode;
 
-use super::common::do_print_search_information;
+use super::{cache::get_titles_cached, common::do_print_search_information, config::Config};
 
 #[derive(Debug, Clone, ValueEnum, Default)]
 pub enum RankingType {
@@ -26,9 +26,15 @@ pub enum RankingType {
 }
 
 impl RankingType {
-    pub fn get_tab(&self) -> Option<&RankingTab> {
-        let find_manual = RANKING_TABS.iter().find(|&t| t.id == self.clone() as u32);
-        find_manual
+    /// Get the ranking tab for this type.
+    ///
+    /// Every variant matches an entry in [`RANKING_TABS`], clap already rejects anything else.
+    pub fn get_tab(&self) -> &'static RankingTab {
+        let tab_id = self.clone() as u32;
+        RANKING_TABS
+            .iter()
+            .find(|&t| t.id == tab_id)
+            .expect("Every ranking type should have a ranking tab")
     }
 }
 
@@ -36,17 +42,12 @@ pub(crate) async fn kmkc_home_rankings(
     ranking: Option<RankingType>,
     limit: Option<u32>,
     client: &KMClient,
+    account: &Config,
     console: &crate::term::Terminal,
 ) -> ExitCode {
     let ranking = ranking.unwrap_or_default();
 
-    let rank_tab = match ranking.get_tab() {
-        Some(tab) => tab,
-        None => {
-            console.error(&format!("Invalid ranking type: {:?}", ranking));
-            return 1;
-        }
-    };
+    let rank_tab = ranking.get_tab();
     let limit = limit.unwrap_or(25);
 
     console.info(&cformat!(
@@ -75,9 +76,13 @@ pub(crate) async fn kmkc_home_rankings(
                 rank_tab.name
             ));
 
-            let all_titles = client
-                .get_titles(results.titles.iter().map(|t| t.id).collect())
-                .await;
+            let all_titles = get_titles_cached(
+                client,
+                account,
+                &format!("ranking_{}", rank_tab.id),
+                results.titles.iter().map(|t| t.id).collect(),
+            )
+            .await;
 
             match all_titles {
                 Err(err) => {
@@ -102,3 +107,15 @@ pub(crate) async fn kmkc_home_rankings(
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_ranking_type_has_tab() {
+        for ranking in RankingType::value_variants() {
+            assert_eq!(ranking.get_tab().id, ranking.clone() as u32);
+        }
+    }
+}
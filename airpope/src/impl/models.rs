@@ -1,5 +1,7 @@
+use std::io::Write;
 use std::str::FromStr;
 
+use chrono::TimeZone;
 use serde::{Deserialize, Serialize};
 use airpope_amap::models::{ComicEpisodeInfo, ComicEpisodeInfoNode};
 use airpope_kmkc::models::EpisodeNode;
@@ -7,6 +9,9 @@ use airpope_musq::proto::ChapterV2;
 use airpope_rbean::models::Chapter;
 use airpope_sjv::models::MangaChapterDetail;
 
+/// UTC offset of JST (UTC+9) in seconds, MU! release dates are in JST.
+const JST_OFFSET_SECS: i64 = 9 * 3600;
+
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq, Hash, PartialOrd, Ord)]
 #[serde(untagged)]
 pub enum IdDump {
@@ -89,31 +94,33 @@ impl MangaDetailDump {
     /// * `save_path` - The path to save the dump.
     pub fn dump(&self, save_path: &std::path::PathBuf) -> std::io::Result<()> {
         let file = std::fs::File::create(save_path)?;
-        serde_json::to_writer_pretty(file, self)?;
+        // serde_json writes in small pieces, buffer them to avoid a syscall per token
+        let mut writer = std::io::BufWriter::new(file);
+        serde_json::to_writer_pretty(&mut writer, self)?;
+        writer.flush()?;
         Ok(())
     }
 }
 
+/// Parse MU! release date (e.g. `Jan 02, 2024`) into a UTC timestamp.
+fn parse_mu_published_timestamp(published: &str) -> i64 {
+    // assume JST, midnight JST is 9 hours before midnight UTC
+    let parsed = chrono::NaiveDate::parse_from_str(published, "%b %d, %Y")
+        .map(|d| chrono::Utc.from_utc_datetime(&d.and_hms_opt(0, 0, 0).unwrap()))
+        .unwrap_or_else(|_| panic!("Failed to parse published date to JST TZ: {}", published));
+
+    // to timestamp
+    parsed.timestamp() - JST_OFFSET_SECS
+}
+
 impl From<ChapterV2> for ChapterDetailDump {
     /// Convert from [`airpope_musq::proto::ChapterV2`] into [`ChapterDetailDump`]
     /// `_info.json` format.
     fn from(value: ChapterV2) -> Self {
-        let pub_at = match value.published_at {
-            Some(published) => {
-                // assume JST
-                let published = chrono::NaiveDate::parse_from_str(&published, "%b %d, %Y")
-                    .map(|d| d.and_hms_opt(0, 0, 0).unwrap())
-                    .map(|d| d.and_local_timezone(chrono::FixedOffset::east_opt(9 * 3600).unwrap()))
-                    .unwrap_or_else(|_| {
-                        panic!("Failed to parse published date to JST TZ: {}", published)
-                    })
-                    .unwrap();
-
-                // to timestamp
-                Some(published.timestamp())
-            }
-            None => None,
-        };
+        let pub_at = value
+            .published_at
+            .as_deref()
+            .map(parse_mu_published_timestamp);
 
         Self {
             id: value.id.into(),
@@ -233,4 +240,17 @@ mod tests {
         assert_eq!(chapter.timestamp, Some(1620000000));
         assert_eq!(chapter.sub_name, Some("Sub Chapter".to_string()));
     }
+
+    #[test]
+    fn test_parse_mu_published_timestamp() {
+        // 2024-01-02 00:00 JST
+        assert_eq!(
+            super::parse_mu_published_timestamp("Jan 02, 2024"),
+            1704121200
+        );
+        assert_eq!(
+            super::parse_mu_published_timestamp("Jan 03, 2024"),
+            1704207600
+        );
+    }
 }
@@ -5,7 +5,7 @@ use airpope_musq::MUClient;
 
 use crate::{
     cli::ExitCode,
-    config::{get_all_config, save_config, try_remove_config},
+    config::{get_all_config, iter_all_config, save_config, try_remove_config},
     r#impl::common::unix_timestamp_to_string,
 };
 
@@ -53,11 +53,14 @@ pub(crate) async fn musq_auth_session(
         DeviceKind::Apple => DeviceType::Apple,
     };
 
-    let all_configs = get_all_config(&crate::r#impl::Implementations::Musq, None);
-    let old_config = all_configs.iter().find(|&c| match c {
-        crate::config::ConfigImpl::Musq(c) => c.session == session_id && c.r#type == r#type as i32,
-        _ => false,
-    });
+    // stop reading the saved configs as soon as we find a match
+    let old_config =
+        iter_all_config(&crate::r#impl::Implementations::Musq, None).find(|c| match c {
+            crate::config::ConfigImpl::Musq(c) => {
+                c.session == session_id && c.r#type == r#type as i32
+            }
+            _ => false,
+        });
 
     let mut old_id: Option<String> = None;
     if let Some(old_config) = old_config {
@@ -70,7 +73,7 @@ pub(crate) async fn musq_auth_session(
 
         match old_config {
             crate::config::ConfigImpl::Musq(c) => {
-                old_id = Some(c.id.clone());
+                old_id = Some(c.id);
             }
             _ => unreachable!(),
         }
@@ -147,24 +150,22 @@ pub async fn musq_account_info(
     let account = client.get_account().await;
     match account {
         Ok(account) => {
-            console.info(&cformat!(
-                "Account info for <magenta,bold>{}</>:",
-                acc_info.id
-            ));
-            console.info(&cformat!("  <bold>Session:</> {}", acc_info.session));
-            console.info(&cformat!(
-                "  <bold>Type:</> {}",
-                acc_info.r#type().to_name()
-            ));
-            console.info(&cformat!("  <bold>Registered?</> {}", account.registered()));
+            let mut info_lines = vec![
+                cformat!("Account info for <magenta,bold>{}</>:", acc_info.id),
+                cformat!("  <bold>Session:</> {}", acc_info.session),
+                cformat!("  <bold>Type:</> {}", acc_info.r#type().to_name()),
+                cformat!("  <bold>Registered?</> {}", account.registered()),
+            ];
             if !account.devices.is_empty() {
-                console.info(&cformat!("  <bold>Devices:</>"));
-                for device in account.devices {
-                    let device_name = device.name;
-                    let device_id = device.id;
-                    console.info(&cformat!("    - <bold>{}:</> ({})", device_name, device_id));
-                }
+                info_lines.push(cformat!("  <bold>Devices:</>"));
+                info_lines.extend(
+                    account
+                        .devices
+                        .iter()
+                        .map(|device| cformat!("    - <bold>{}:</> ({})", device.name, device.id)),
+                );
             }
+            console.info_lines(&info_lines);
 
             0
         }
@@ -188,28 +189,11 @@ pub async fn musq_account_balance(
     let user_shop = client.get_point_shop().await;
     match user_shop {
         Ok(user_shop) => {
-            console.info("Your current point balance:");
             let user_point = user_shop.user_point.clone().unwrap_or_default();
             let total_bal = user_point.sum().to_formatted_string(&Locale::en);
             let paid_point = user_point.paid.to_formatted_string(&Locale::en);
             let xp_point = user_point.event.to_formatted_string(&Locale::en);
             let free_point = user_point.free.to_formatted_string(&Locale::en);
-            console.info(&cformat!(
-                "  - <bold>Total:</> <cyan!,bold><reverse>{}</>c</cyan!,bold>",
-                total_bal
-            ));
-            console.info(&cformat!(
-                "  - <bold>Paid point:</> <yellow!,bold><reverse>{}</>c</yellow!,bold>",
-                paid_point
-            ));
-            console.info(&cformat!(
-                "  - <bold>Event/XP point:</> <magenta,bold><reverse>{}</>c</magenta,bold>",
-                xp_point
-            ));
-            console.info(&cformat!(
-                "  - <bold>Free point:</> <green,bold><reverse>{}</>c</green,bold>",
-                free_point
-            ));
             let subs_status = if !user_shop.subscriptions.is_empty() {
                 let first_subs = user_shop.subscriptions.first().unwrap();
                 let status = first_subs.status().as_name();
@@ -224,7 +208,26 @@ pub async fn musq_account_balance(
             } else {
                 cformat!("<red,bold>Unsubscribed</>")
             };
-            console.info(&cformat!("  - <bold>Subscription:</> {}", subs_status));
+            console.info_lines(&[
+                "Your current point balance:".to_string(),
+                cformat!(
+                    "  - <bold>Total:</> <cyan!,bold><reverse>{}</>c</cyan!,bold>",
+                    total_bal
+                ),
+                cformat!(
+                    "  - <bold>Paid point:</> <yellow!,bold><reverse>{}</>c</yellow!,bold>",
+                    paid_point
+                ),
+                cformat!(
+                    "  - <bold>Event/XP point:</> <magenta,bold><reverse>{}</>c</magenta,bold>",
+                    xp_point
+                ),
+                cformat!(
+                    "  - <bold>Free point:</> <green,bold><reverse>{}</>c</green,bold>",
+                    free_point
+                ),
+                cformat!("  - <bold>Subscription:</> {}", subs_status),
+            ]);
             0
         }
         Err(e) => {
@@ -1,3 +1,5 @@
+use std::collections::HashMap;
+
 use color_print::cformat;
 use num_format::{Locale, ToFormattedString};
 use airpope_musq::{
@@ -142,19 +144,15 @@ pub(super) async fn common_purchase_select(
                         return (Ok(vec![]), None, Some(user_bal));
                     }
 
-                    let mut selected_chapters: Vec<ChapterV2> = vec![];
-
-                    for chapter in selected {
-                        let ch_id = chapter.name.parse::<u64>().unwrap();
-                        let ch = result
-                            .chapters
-                            .iter()
-                            .find(|ch| ch.id == ch_id)
-                            .unwrap()
-                            .clone();
-
-                        selected_chapters.push(ch);
-                    }
+                    let chapters_by_id: HashMap<u64, &ChapterV2> =
+                        result.chapters.iter().map(|ch| (ch.id, ch)).collect();
+                    let selected_chapters: Vec<ChapterV2> = selected
+                        .iter()
+                        .map(|chapter| {
+                            let ch_id = chapter.name.parse::<u64>().unwrap();
+                            (*chapters_by_id.get(&ch_id).unwrap()).clone()
+                        })
+                        .collect();
 
                     (Ok(selected_chapters), Some(result), Some(user_bal))
                 }
@@ -1,13 +1,16 @@
+use std::collections::HashSet;
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
 
 use clap::ValueEnum;
 
 use color_print::cformat;
 use airpope_musq::{
-    proto::{ChapterV2, MangaDetailV2},
+    proto::{ChapterPage, ChapterV2, MangaDetailV2},
     ImageQuality, MUClient,
 };
 
+use crate::term::Terminal;
 use crate::{
     cli::ExitCode,
     r#impl::models::{ChapterDetailDump, MangaDetailDump},
@@ -15,6 +18,11 @@ use crate::{
 
 use super::common::common_purchase_select;
 
+/// Buffer size used when writing downloaded images to disk.
+const IMAGE_WRITE_BUFFER: usize = 1024 * 1024;
+/// Maximum number of images fetched at the same time in parallel mode.
+const PARALLEL_DOWNLOAD_LIMIT: usize = 8;
+
 #[derive(Debug, Clone, Default)]
 pub(crate) enum DownloadImageQuality {
     Normal,
@@ -78,37 +86,39 @@ pub(crate) struct MUDownloadCliConfig {
 
     pub(crate) no_paid_point: bool,
     pub(crate) no_xp_point: bool,
+    pub(crate) parallel: bool,
 }
 
-fn check_downloaded_image_count(image_dir: &PathBuf) -> Option<usize> {
-    // check if dir exist
-    if !image_dir.exists() {
-        return None;
-    }
+/// Check if the chapter directory already has at least `expected` `.avif` images.
+///
+/// Stops reading the directory as soon as enough images are found.
+fn has_downloaded_images(image_dir: &Path, expected: usize) -> bool {
+    let entries = match std::fs::read_dir(image_dir) {
+        Ok(entries) => entries,
+        Err(_) => return false,
+    };
 
-    // check if dir is dir
-    if !image_dir.is_dir() {
-        return None;
-    }
-
-    // check how many .avif files in the dir
     let mut count = 0;
-    for entry in std::fs::read_dir(image_dir).unwrap() {
-        let entry = entry.unwrap();
-        let path = entry.path();
-        if path.is_file() && path.extension().unwrap() == "avif" {
+    for entry in entries.flatten() {
+        // the entry file type comes from the directory listing, no extra stat call
+        let is_file = entry.file_type().map(|ft| ft.is_file()).unwrap_or(false);
+        if is_file && entry.path().extension().is_some_and(|ext| ext == "avif") {
             count += 1;
+            if count >= expected {
+                return true;
+            }
         }
     }
 
-    Some(count)
+    false
 }
 
 fn create_chapters_info(manga_detail: MangaDetailV2) -> MangaDetailDump {
-    let mut chapters: Vec<ChapterDetailDump> = vec![];
-    for chapter in manga_detail.chapters {
-        chapters.push(ChapterDetailDump::from(chapter));
-    }
+    let chapters: Vec<ChapterDetailDump> = manga_detail
+        .chapters
+        .into_iter()
+        .map(ChapterDetailDump::from)
+        .collect();
 
     MangaDetailDump::new(manga_detail.title, manga_detail.authors, chapters)
 }
@@ -133,6 +143,46 @@ fn get_output_directory(
     pathing
 }
 
+struct MUDownloadNode {
+    client: MUClient,
+    image: ChapterPage,
+}
+
+async fn musq_actual_downloader(
+    node: MUDownloadNode,
+    image_dir: PathBuf,
+    console: Terminal,
+    progress: Arc<indicatif::ProgressBar>,
+) -> anyhow::Result<()> {
+    let file_number: u64 = node.image.file_stem().parse()?;
+    let img_fn = format!("p{:03}.{}", file_number, node.image.extension());
+    let img_dl_path = image_dir.join(&img_fn);
+
+    let writer = tokio::fs::File::create(&img_dl_path).await?;
+    let writer = tokio::io::BufWriter::with_capacity(IMAGE_WRITE_BUFFER, writer);
+
+    if console.is_debug() {
+        console.log(&cformat!(
+            "   Downloading image <s>{}</> to <s>{}</>...",
+            node.image.file_name(),
+            img_fn
+        ));
+    }
+
+    match node.client.stream_download(&node.image.url, writer).await {
+        Ok(_) => {}
+        Err(err) => {
+            console.error(&format!("    Failed to download image: {}", err));
+            // silent delete the file
+            tokio::fs::remove_file(&img_dl_path).await?;
+        }
+    }
+
+    progress.inc(1);
+
+    Ok(())
+}
+
 pub(crate) async fn musq_download(
     title_id: u64,
     dl_config: MUDownloadCliConfig,
@@ -152,6 +202,7 @@ pub(crate) async fn musq_download(
 
     match (results, manga_detail, user_bal) {
         (Ok(results), Some(manga_detail), Some(coin_purse)) => {
+            let selected_ids: HashSet<usize> = dl_config.chapter_ids.iter().copied().collect();
             let results: Vec<&ChapterV2> = results
                 .iter()
                 .filter(|&ch| {
@@ -172,8 +223,7 @@ pub(crate) async fn musq_download(
                         }
                     } else {
                         // allow if chapter_ids is empty or chapter id is in chapter_ids
-                        dl_config.chapter_ids.is_empty()
-                            || dl_config.chapter_ids.contains(&(ch.id as usize))
+                        selected_ids.is_empty() || selected_ids.contains(&(ch.id as usize))
                     }
                 })
                 .collect();
@@ -360,15 +410,13 @@ pub(crate) async fn musq_download(
                 }
 
                 let ch_dir = get_output_directory(&output_dir, title_id, Some(chapter.id), false);
-                if let Some(count) = check_downloaded_image_count(&ch_dir) {
-                    if count >= image_blocks.len() {
-                        console.warn(&cformat!(
-                            "   Chapter <m,s>{}</> (<s>{}</>) has been downloaded, skipping",
-                            chapter.title,
-                            chapter.id
-                        ));
-                        continue;
-                    }
+                if has_downloaded_images(&ch_dir, image_blocks.len()) {
+                    console.warn(&cformat!(
+                        "   Chapter <m,s>{}</> (<s>{}</>) has been downloaded, skipping",
+                        chapter.title,
+                        chapter.id
+                    ));
+                    continue;
                 }
 
                 // create folder
@@ -376,37 +424,68 @@ pub(crate) async fn musq_download(
 
                 // download images
                 let total_image_count = image_blocks.len() as u64;
-                for image in image_blocks {
-                    let file_number: u64 = image.file_stem().parse().unwrap();
-                    let img_fn = format!("p{:03}.{}", file_number, image.extension());
-                    let img_dl_path = ch_dir.join(&img_fn);
-                    // async download
-                    let writer = tokio::fs::File::create(&img_dl_path)
-                        .await
-                        .expect("Failed to create image file");
-
-                    if console.is_debug() {
-                        console.log(&cformat!(
-                            "   Downloading image <s>{}</> to <s>{}</>...",
-                            image.file_name(),
-                            img_fn
-                        ));
-                    } else {
-                        console.progress(total_image_count, 1, Some("Downloading".to_string()));
-                    }
-
-                    match client.stream_download(&image.url, writer).await {
-                        Ok(_) => {}
-                        Err(err) => {
-                            console.error(&format!("    Failed to download image: {}", err));
-                            // silent delete the file
-                            tokio::fs::remove_file(&img_dl_path)
+                let progress = Arc::new(
+                    console.make_progress(total_image_count, Some("Downloading".to_string())),
+                );
+
+                if dl_config.parallel {
+                    let semaphore = Arc::new(tokio::sync::Semaphore::new(PARALLEL_DOWNLOAD_LIMIT));
+                    let tasks: Vec<_> = image_blocks
+                        .iter()
+                        .map(|&image| {
+                            // wrap function in async block
+                            let wrap_client = client.clone();
+                            let ch_dir = ch_dir.clone();
+                            let cnsl = console.clone();
+                            let image = image.clone();
+                            let progress = Arc::clone(&progress);
+                            let semaphore = Arc::clone(&semaphore);
+
+                            tokio::spawn(async move {
+                                // hold a permit for the whole download so we don't flood the CDN
+                                let _permit = semaphore.acquire_owned().await.unwrap();
+                                match musq_actual_downloader(
+                                    MUDownloadNode {
+                                        client: wrap_client,
+                                        image,
+                                    },
+                                    ch_dir,
+                                    cnsl.clone(),
+                                    progress,
+                                )
                                 .await
-                                .unwrap_or_default();
+                                {
+                                    Ok(_) => {}
+                                    Err(e) => {
+                                        cnsl.error(&format!("    Failed to download image: {}", e));
+                                    }
+                                }
+                            })
+                        })
+                        .collect();
+
+                    futures::future::join_all(tasks).await;
+                } else {
+                    for &image in image_blocks.iter() {
+                        match musq_actual_downloader(
+                            MUDownloadNode {
+                                client: client.clone(),
+                                image: image.clone(),
+                            },
+                            ch_dir.clone(),
+                            console.clone(),
+                            Arc::clone(&progress),
+                        )
+                        .await
+                        {
+                            Ok(_) => {}
+                            Err(e) => {
+                                console.error(&format!("    Failed to download image: {}", e));
+                            }
                         }
                     }
                 }
-                console.stop_progress(Some("Downloaded".to_string()));
+                progress.finish_with_message("Downloaded");
             }
 
             0
@@ -53,6 +53,9 @@ pub(crate) enum MUSQCommands {
         /// Output directory to use
         #[arg(short = 'o', long = "output", default_value = None)]
         output: Option<PathBuf>,
+        /// Enable parallel download
+        #[arg(short = 'p', long = "parallel")]
+        parallel: bool,
     },
     /// Get your account point balance
     Balance,
@@ -75,6 +78,9 @@ pub(crate) enum MUSQCommands {
         /// Output directory to use
         #[arg(short = 'o', long = "output", default_value = None)]
         output: Option<PathBuf>,
+        /// Enable parallel download
+        #[arg(short = 'x', long = "parallel")]
+        parallel: bool,
     },
     /// Get your account favorites list
     Favorites,
@@ -1,4 +1,4 @@
-use std::str::FromStr;
+use std::{collections::HashSet, str::FromStr};
 
 use clap::ValueEnum;
 use airpope_macros::EnumName;
@@ -131,8 +131,11 @@ impl FromStr for NumberOrString {
 }
 
 /// Value parser for comma separated numbers
+///
+/// Duplicated numbers are dropped while keeping the first occurrence order.
 pub(super) fn parse_comma_number(s: &str) -> Result<CommaSeparatedNumber, String> {
     let mut numbers = Vec::new();
+    let mut seen = HashSet::new();
 
     for number in s.split(',') {
         let number = number.trim();
@@ -140,7 +143,9 @@ pub(super) fn parse_comma_number(s: &str) -> Result<CommaSeparatedNumber, String
             .parse()
             .map_err(|_| format!("Invalid number: {}", number))?;
 
-        numbers.push(number);
+        if seen.insert(number) {
+            numbers.push(number);
+        }
     }
 
     Ok(numbers)
@@ -170,6 +175,13 @@ mod tests {
         assert_eq!(parsed.unwrap(), vec![1, 2, 3, 4, 5]);
     }
 
+    #[test]
+    fn test_parse_comma_number_dedup() {
+        let parsed = parse_comma_number("3,1,3,2,1");
+        assert!(parsed.is_ok());
+        assert_eq!(parsed.unwrap(), vec![3, 1, 2]);
+    }
+
     #[test]
     fn test_parse_comma_number_invalid() {
         let parsed = parse_comma_number("aaa,bbb");
@@ -26,7 +26,7 @@ pub(super) fn do_print_single_information(
         true => term.info(&format!("{}[{:02}] {}", pre_space, index + 1, text_data)),
         false => term.info(&format!("{}{}", pre_space, text_data)),
     }
-    let updated_at = result.last_updated.format("%Y-%m-%d").to_string();
+    let updated_at = result.last_updated.date_naive().to_string();
     term.info(&cformat!(
         "{}<s>Last update</s>: {}",
         pre_space_lupd,
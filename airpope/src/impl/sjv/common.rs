@@ -31,7 +31,7 @@ pub(super) fn do_print_search_information(
             true => term.info(&format!("{}[{:02}] {}", pre_space, idx + 1, text_data)),
             false => term.info(&format!("{}{}", pre_space, text_data)),
         }
-        let updated_at = result.updated_at.format("%Y-%m-%d").to_string();
+        let updated_at = result.updated_at.date_naive().to_string();
         term.info(&cformat!(
             "{}<s>Last update</s>: {}",
             pre_space_lupd,
@@ -159,6 +159,7 @@ async fn main() {
                     no_xp_coins,
                     quality,
                     output,
+                    parallel,
                 } => {
                     let mu_config = MUDownloadCliConfig {
                         auto_purchase: !no_purchase,
@@ -168,6 +169,7 @@ async fn main() {
                         end_at: end_until,
                         no_paid_point: no_paid_coins,
                         no_xp_point: no_xp_coins,
+                        parallel,
                         ..Default::default()
                     };
 
@@ -190,12 +192,14 @@ async fn main() {
                     auto_purchase,
                     quality,
                     output,
+                    parallel,
                 } => {
                     let mu_config = MUDownloadCliConfig {
                         auto_purchase,
                         show_all,
                         chapter_ids: chapters.unwrap_or_default(),
                         quality,
+                        parallel,
                         ..Default::default()
                     };
 
@@ -335,6 +339,7 @@ async fn main() {
                     no_point,
                     output,
                     parallel,
+                    fast_png,
                 } => {
                     let main_config = KMDownloadCliConfig {
                         auto_purchase: !no_purchase,
@@ -344,6 +349,7 @@ async fn main() {
                         no_point,
                         no_ticket,
                         parallel,
+                        fast_png,
                         ..Default::default()
                     };
 
@@ -367,12 +373,14 @@ async fn main() {
                     auto_purchase,
                     output,
                     parallel,
+                    fast_png,
                 } => {
                     let main_config = KMDownloadCliConfig {
                         auto_purchase,
                         show_all,
                         chapter_ids: chapters.unwrap_or_default(),
                         parallel,
+                        fast_png,
                         ..Default::default()
                     };
 
@@ -412,8 +420,14 @@ async fn main() {
                     .await
                 }
                 KMKCCommands::Rankings { ranking_tab, limit } => {
-                    r#impl::kmkc::rankings::kmkc_home_rankings(ranking_tab, limit, &client, &t)
-                        .await
+                    r#impl::kmkc::rankings::kmkc_home_rankings(
+                        ranking_tab,
+                        limit,
+                        &client,
+                        &config,
+                        &t,
+                    )
+                    .await
                 }
                 KMKCCommands::Revoke => r#impl::kmkc::accounts::kmkc_account_revoke(&config, &t),
                 KMKCCommands::Search { query } => {
@@ -52,6 +52,21 @@ impl Terminal {
         println!("{}", cformat!(" [<cyan,strong>INFO</cyan,strong>] {}", msg))
     }
 
+    /// Log multiple info lines to terminal with a single write
+    pub fn info_lines<S: AsRef<str>>(&self, lines: &[S]) {
+        if lines.is_empty() {
+            return;
+        }
+
+        let prefix = cformat!(" [<cyan,strong>INFO</cyan,strong>]");
+        let merged = lines
+            .iter()
+            .map(|line| format!("{} {}", prefix, line.as_ref()))
+            .collect::<Vec<String>>()
+            .join("\n");
+        println!("{}", merged)
+    }
+
     /// Log warning to terminal
     pub fn warn(&self, msg: &str) {
         println!(
@@ -167,7 +182,8 @@ impl Terminal {
         }
     }
 
-    fn make_progress(&self, len: u64, message: Option<String>) -> indicatif::ProgressBar {
+    /// Create a standalone progress bar with the shared style
+    pub fn make_progress(&self, len: u64, message: Option<String>) -> indicatif::ProgressBar {
         let progress = indicatif::ProgressBar::new(len);
         progress.enable_steady_tick(Duration::from_millis(120));
         progress.set_style(
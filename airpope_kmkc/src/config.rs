@@ -295,21 +295,27 @@ impl TryFrom<String> for KMConfigWeb {
         let mut privacy = KMConfigWebKV::default();
 
         for cookie_line in value.lines() {
-            if cookie_line.starts_with('#') && !cookie_line.starts_with("#HttpOnly_") {
+            if cookie_line.trim().is_empty()
+                || (cookie_line.starts_with('#') && !cookie_line.starts_with("#HttpOnly_"))
+            {
                 continue;
             }
 
             // cookie is separated by tabs
             // domain, include subdomain, path, secure, expiration, name, value
-            let cookie_parts: Vec<&str> = cookie_line.split('\t').collect();
-            if cookie_parts.len() != 7 {
-                return Err(KMConfigWebFromStrError {
-                    line: cookie_line.to_string(),
-                });
-            }
-
-            let cookie_name = cookie_parts[5];
-            let cookie_value = cookie_parts[6];
+            let mut cookie_parts = cookie_line.split('\t');
+            let (cookie_name, cookie_value) = match (
+                cookie_parts.nth(5),
+                cookie_parts.next(),
+                cookie_parts.next(),
+            ) {
+                (Some(name), Some(value), None) => (name, value),
+                _ => {
+                    return Err(KMConfigWebFromStrError {
+                        line: cookie_line.to_string(),
+                    })
+                }
+            };
 
             match cookie_name {
                 "uwt" => uwt = cookie_value.to_string(),
@@ -356,6 +362,23 @@ mod tests {
         assert_eq!(decoded_cookie, "{\"value\":123,\"expires\":123}");
     }
 
+    #[test]
+    fn test_web_from_netscape_cookies() {
+        let cookies = [
+            "# Netscape HTTP Cookie File",
+            "",
+            "example.com\tFALSE\t/\tTRUE\t0\tother\tskipped",
+            "#HttpOnly_example.com\tFALSE\t/\tTRUE\t0\tuwt\ttest-uwt",
+        ]
+        .join("\n");
+
+        let config = KMConfigWeb::try_from(cookies).unwrap_or_else(|e| panic!("{}", e));
+        assert_eq!(config.uwt, "test-uwt");
+
+        let invalid = "example.com\tFALSE\t/\tTRUE\t0\tuwt".to_string();
+        assert!(KMConfigWeb::try_from(invalid).is_err());
+    }
+
     #[test]
     fn test_mobile_platform_u8() {
         assert_eq!(KMConfigMobilePlatform::Apple as u8, 1);
@@ -38,7 +38,7 @@ pub struct RankingTab {
 }
 
 impl RankingTab {
-    fn new(id: u32, name: &'static str, tab: &'static str) -> Self {
+    const fn new(id: u32, name: &'static str, tab: &'static str) -> Self {
         Self { id, name, tab }
     }
 }
@@ -157,25 +157,25 @@ lazy_static! {
         )
         .expect("Invalid base64 string (IMAGE_HOST)")
     };
-
-    /// The ranking tabs used for the ranking endpoint.
-    ///
-    /// See: [`crate::KMClient::get_all_rankings`] for more info
-    pub static ref RANKING_TABS: Vec<RankingTab> = vec![
-        RankingTab::new(3, "Action", "action"),
-        RankingTab::new(4, "Sports", "sports"),
-        RankingTab::new(5, "Romance", "romance"),
-        RankingTab::new(6, "Isekai", "isekai"),
-        RankingTab::new(7, "Suspense", "romance"),
-        RankingTab::new(8, "Outlaws", "outlaws"),
-        RankingTab::new(9, "Drama", "drama"),
-        RankingTab::new(10, "Fantasy", "fantasy"),
-        RankingTab::new(11, "Slice of Life", "sol"),
-        RankingTab::new(12, "All", "all"),
-        RankingTab::new(13, "Today's Specials", "specials"),
-    ];
 }
 
+/// The ranking tabs used for the ranking endpoint.
+///
+/// See: [`crate::KMClient::get_all_rankings`] for more info
+pub static RANKING_TABS: [RankingTab; 11] = [
+    RankingTab::new(3, "Action", "action"),
+    RankingTab::new(4, "Sports", "sports"),
+    RankingTab::new(5, "Romance", "romance"),
+    RankingTab::new(6, "Isekai", "isekai"),
+    RankingTab::new(7, "Suspense", "romance"),
+    RankingTab::new(8, "Outlaws", "outlaws"),
+    RankingTab::new(9, "Drama", "drama"),
+    RankingTab::new(10, "Fantasy", "fantasy"),
+    RankingTab::new(11, "Slice of Life", "sol"),
+    RankingTab::new(12, "All", "all"),
+    RankingTab::new(13, "Today's Specials", "specials"),
+];
+
 /// Returns the constants for the given device type.
 ///
 /// # Arguments
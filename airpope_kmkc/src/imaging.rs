@@ -15,7 +15,9 @@
 
 use std::io::Cursor;
 
-use image::{GenericImage, GenericImageView, ImageEncoder};
+use image::{GenericImageView, ImageEncoder};
+
+pub use image::codecs::png::CompressionType;
 
 fn u32_to_f32(n: u32) -> f32 {
     if n > i32::MAX as u32 {
@@ -107,57 +109,141 @@ pub fn descramble_image(
     rectbox: u32,
     scramble_seed: u32,
 ) -> anyhow::Result<Vec<u8>> {
-    // read img_source as image
-    let img = image::load_from_memory(img_bytes)?;
-
-    let (width, height) = img.dimensions();
-    let (width_rect, height_rect) = calc_block_size(width, height, rectbox);
-
-    match (width_rect, height_rect) {
-        (Some(width_rect), Some(height_rect)) => {
-            let mut canvas =
-                image::DynamicImage::new(width_rect * rectbox, height_rect * rectbox, img.color());
-
-            for ((source_x, source_y), (dest_x, dest_y)) in
-                generate_copy_targets(rectbox, scramble_seed)
-            {
-                let source_x = source_x * width_rect;
-                let source_y = source_y * height_rect;
-                let dest_x = dest_x * width_rect;
-                let dest_y = dest_y * height_rect;
-
-                let cropped_img = img.crop_imm(source_x, source_y, width_rect, height_rect);
-                canvas.copy_from(&cropped_img, dest_x, dest_y).unwrap_or_else(|_| {
-                    panic!("Failed to copy from source image to canvas. source_x: {}, source_y: {}, dest_x: {}, dest_y: {}", source_x, source_y, dest_x, dest_y)
-                });
-            }
+    descramble_image_with_compression(img_bytes, rectbox, scramble_seed, CompressionType::Best)
+}
+
+/// Descramble image bytes with the given PNG compression, and return descrambled image bytes.
+///
+/// Same as [`descramble_image`], but allow trading output size for encoding speed
+/// by using something like [`CompressionType::Fast`].
+///
+/// # Arguments
+/// * `img_bytes` - Image bytes to descramble.
+/// * `rectbox` - How much block that divide the images, usually `4`.
+/// * `scramble_seed` - The seed used to scramble the image.
+/// * `compression` - The PNG compression used for the output image.
+pub fn descramble_image_with_compression(
+    img_bytes: &[u8],
+    rectbox: u32,
+    scramble_seed: u32,
+    compression: CompressionType,
+) -> anyhow::Result<Vec<u8>> {
+    Descrambler::new(rectbox, scramble_seed).descramble_with_compression(img_bytes, compression)
+}
+
+/// A reusable image descrambler for a given `rectbox` and seed.
+///
+/// Every page in a chapter share the same seed, so the block layout can be computed
+/// once per chapter and reused for each page instead of calling [`descramble_image`].
+///
+/// # Example
+/// ```no_run
+/// use airpope_kmkc::imaging::Descrambler;
+///
+/// let img_bytes = [0_u8; 100];
+///
+/// let descrambler = Descrambler::new(4, 749191485);
+/// let descrambled_img_bytes = descrambler.descramble(&img_bytes).unwrap();
+/// ```
+#[derive(Debug, Clone)]
+pub struct Descrambler {
+    rectbox: u32,
+    copy_targets: Vec<((u32, u32), (u32, u32))>,
+}
 
-            // output image to Vec<u8>
-            let mut buf = Cursor::new(Vec::new());
-
-            image::codecs::png::PngEncoder::new_with_quality(
-                &mut buf,
-                image::codecs::png::CompressionType::Best,
-                image::codecs::png::FilterType::Adaptive,
-            )
-            .write_image(
-                canvas.as_bytes(),
-                canvas.width(),
-                canvas.height(),
-                canvas.color().into(),
-            )?;
-
-            buf.set_position(0);
-
-            let data = buf.into_inner();
-            // Close the file handle
-            drop(img);
-            drop(canvas);
-
-            Ok(data)
+impl Descrambler {
+    /// Create a new descrambler.
+    ///
+    /// # Arguments
+    /// * `rectbox` - How much block that divide the images, usually `4`.
+    /// * `scramble_seed` - The seed used to scramble the image. Available in the [`crate::models::WebEpisodeViewerResponse`]
+    ///                     response.
+    pub fn new(rectbox: u32, scramble_seed: u32) -> Self {
+        Self {
+            rectbox,
+            copy_targets: generate_copy_targets(rectbox, scramble_seed),
         }
-        _ => {
-            anyhow::bail!("Image is too small!")
+    }
+
+    /// Descramble image bytes, and return descrambled image bytes.
+    ///
+    /// # Arguments
+    /// * `img_bytes` - Image bytes to descramble.
+    pub fn descramble(&self, img_bytes: &[u8]) -> anyhow::Result<Vec<u8>> {
+        self.descramble_with_compression(img_bytes, CompressionType::Best)
+    }
+
+    /// Descramble image bytes with the given PNG compression, and return descrambled image bytes.
+    ///
+    /// # Arguments
+    /// * `img_bytes` - Image bytes to descramble.
+    /// * `compression` - The PNG compression used for the output image.
+    pub fn descramble_with_compression(
+        &self,
+        img_bytes: &[u8],
+        compression: CompressionType,
+    ) -> anyhow::Result<Vec<u8>> {
+        let rectbox = self.rectbox;
+
+        // read img_source as image
+        let img = image::load_from_memory(img_bytes)?;
+
+        let (width, height) = img.dimensions();
+        let (width_rect, height_rect) = calc_block_size(width, height, rectbox);
+
+        match (width_rect, height_rect) {
+            (Some(width_rect), Some(height_rect)) => {
+                let color = img.color();
+                let bpp = color.bytes_per_pixel() as usize;
+                let canvas_width = width_rect * rectbox;
+                let canvas_height = height_rect * rectbox;
+
+                // Both images share the same pixel layout, so each tile can be moved
+                // row by row as raw bytes instead of going pixel per pixel.
+                let source = img.as_bytes();
+                let source_stride = width as usize * bpp;
+                let canvas_stride = canvas_width as usize * bpp;
+                let tile_stride = width_rect as usize * bpp;
+                let mut canvas = vec![0_u8; canvas_stride * canvas_height as usize];
+
+                for &((source_x, source_y), (dest_x, dest_y)) in self.copy_targets.iter() {
+                    let source_x = (source_x * width_rect) as usize * bpp;
+                    let source_y = (source_y * height_rect) as usize;
+                    let dest_x = (dest_x * width_rect) as usize * bpp;
+                    let dest_y = (dest_y * height_rect) as usize;
+
+                    for row in 0..height_rect as usize {
+                        let src_start = (source_y + row) * source_stride + source_x;
+                        let dest_start = (dest_y + row) * canvas_stride + dest_x;
+                        canvas[dest_start..dest_start + tile_stride]
+                            .copy_from_slice(&source[src_start..src_start + tile_stride]);
+                    }
+                }
+
+                // The source is no longer needed, free it before encoding so we
+                // don't hold two decoded images and the PNG buffer at once.
+                drop(img);
+
+                // output image to Vec<u8>
+                let mut buf = Cursor::new(Vec::new());
+
+                image::codecs::png::PngEncoder::new_with_quality(
+                    &mut buf,
+                    compression,
+                    image::codecs::png::FilterType::Adaptive,
+                )
+                .write_image(&canvas, canvas_width, canvas_height, color.into())?;
+
+                buf.set_position(0);
+
+                let data = buf.into_inner();
+                drop(canvas);
+
+                Ok(data)
+            }
+            _ => {
+                anyhow::bail!("Image is too small!")
+            }
         }
     }
 }
@@ -234,6 +320,16 @@ mod tests {
         assert_eq!(copy_targets, expect_targets);
     }
 
+    #[test]
+    fn test_descrambler_copy_targets() {
+        let descrambler = Descrambler::new(4, 749191485);
+        assert_eq!(descrambler.rectbox, 4);
+        assert_eq!(
+            descrambler.copy_targets,
+            generate_copy_targets(4, 749191485)
+        );
+    }
+
     #[test]
     #[should_panic]
     fn test_u32_to_f32_panic() {
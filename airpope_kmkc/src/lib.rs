@@ -104,6 +104,9 @@ use reqwest_cookie_store::CookieStoreMutex;
 use sha2::{Digest, Sha256, Sha512};
 use tokio::io::AsyncWriteExt;
 
+/// TCP keep-alive interval, commands usually make several requests to the same host.
+const TCP_KEEPALIVE: std::time::Duration = std::time::Duration::from_secs(60);
+
 /// Login result for the API.
 ///
 /// This will return either a [`KMConfig::Web`] or [`KMConfig::Mobile`] depending on the login type.
@@ -186,6 +189,7 @@ impl KMClient {
                 let client = reqwest::Client::builder()
                     .http2_adaptive_window(true)
                     .use_rustls_tls()
+                    .tcp_keepalive(TCP_KEEPALIVE)
                     .default_headers(headers)
                     .cookie_provider(std::sync::Arc::clone(&cookie_store));
 
@@ -214,6 +218,7 @@ impl KMClient {
                 let client = reqwest::Client::builder()
                     .http2_adaptive_window(true)
                     .use_rustls_tls()
+                    .tcp_keepalive(TCP_KEEPALIVE)
                     .default_headers(headers)
                     .cookie_provider(std::sync::Arc::clone(&cookie_store));
 
@@ -795,6 +800,35 @@ impl KMClient {
         &self,
         url: &str,
         scramble_seed: Option<u32>,
+        writer: impl tokio::io::AsyncWrite + std::marker::Unpin,
+    ) -> anyhow::Result<()> {
+        let descrambler =
+            scramble_seed.map(|seed| std::sync::Arc::new(imaging::Descrambler::new(4, seed)));
+        self.stream_download_with_compression(
+            url,
+            descrambler,
+            imaging::CompressionType::Best,
+            writer,
+        )
+        .await
+    }
+
+    /// Stream download the image from the given URL, with custom PNG compression.
+    ///
+    /// Same as [`Self::stream_download`], but take a prebuilt [`imaging::Descrambler`]
+    /// so it can be shared by every page of a chapter. The `compression` is only used
+    /// when re-encoding descrambled Web images.
+    ///
+    /// # Arguments
+    /// * `url` - The URL to download the image from
+    /// * `descrambler` - The descrambler to use for the image (only for Web, please provide it!)
+    /// * `compression` - The PNG compression used for descrambled images
+    /// * `writer` - The writer to write the image to
+    pub async fn stream_download_with_compression(
+        &self,
+        url: &str,
+        descrambler: Option<std::sync::Arc<imaging::Descrambler>>,
+        compression: imaging::CompressionType,
         mut writer: impl tokio::io::AsyncWrite + std::marker::Unpin,
     ) -> anyhow::Result<()> {
         let res = self
@@ -815,7 +849,7 @@ impl KMClient {
             .send()
             .await?;
 
-        match (&self.config, scramble_seed) {
+        match (&self.config, descrambler) {
             (KMConfig::Mobile(_), _) => {
                 let mut stream = res.bytes_stream();
                 while let Some(item) = stream.next().await {
@@ -825,10 +859,10 @@ impl KMClient {
 
                 Ok(())
             }
-            (KMConfig::Web(_), Some(scramble_seed)) => {
+            (KMConfig::Web(_), Some(descrambler)) => {
                 let image_bytes = res.bytes().await?;
                 let descrambled = tokio::task::spawn_blocking(move || {
-                    imaging::descramble_image(image_bytes.as_ref(), 4, scramble_seed)
+                    descrambler.descramble_with_compression(image_bytes.as_ref(), compression)
                 })
                 .await?;
 
@@ -885,6 +919,7 @@ impl KMClient {
         let client = reqwest::Client::builder()
             .http2_adaptive_window(true)
             .use_rustls_tls()
+            .tcp_keepalive(TCP_KEEPALIVE)
             .default_headers(headers)
             .cookie_provider(std::sync::Arc::clone(&cookie_store))
             .build()?;
@@ -919,8 +954,13 @@ impl KMClient {
         }
 
         let unparse_web = KMConfigWeb::from(cookie_store.lock().unwrap().clone());
-        // Get account info
-        let km_client = KMClient::new(KMConfig::Web(unparse_web.clone()));
+        // Get account info, reuse the login session so the connection is kept alive
+        let km_client = KMClient {
+            inner: client,
+            config: KMConfig::Web(unparse_web.clone()),
+            constants: get_constants(3),
+            cookie_store,
+        };
         let account = km_client.get_account().await?;
 
         if mobile_platform.is_none() {
@@ -1,32 +1,29 @@
+from collections import defaultdict
 from pathlib import Path
+from typing import DefaultDict, Set
 
-import toml
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
 CURRENT_DIR = Path(__file__).parent.absolute()
 ROOT_DIR = CURRENT_DIR.parent
 
-cargo_lock = toml.load(ROOT_DIR / "Cargo.lock")
+with (ROOT_DIR / "Cargo.lock").open("rb") as fp:
+    cargo_lock = tomllib.load(fp)
 
-duplicate_deps = {}
-merged_deps = {}
+versions: DefaultDict[str, Set[str]] = defaultdict(set)
 for package in cargo_lock["package"]:
-    name = package["name"]
-    version = package["version"]
-    if name not in merged_deps:
-        merged_deps[name] = version
-    elif merged_deps[name] != version:
-        if name not in duplicate_deps:
-            duplicate_deps[name] = [(name, version, merged_deps[name])]
-        else:
-            duplicate_deps[name].append((name, version, merged_deps[name]))
+    versions[package["name"]].add(package["version"])
 
+duplicate_deps = {name: vers for name, vers in versions.items() if len(vers) > 1}
 
 if duplicate_deps:
     print("Duplicate dependencies found:")
-    for name, versions in duplicate_deps.items():
-        main_ver = merged_deps[name]
-        print(f"  {name} {main_ver}:")
-        for _, version, _ in versions:
+    for name, vers in sorted(duplicate_deps.items()):
+        print(f"  {name}:")
+        for version in sorted(vers):
             print(f"    - {version}")
 else:
     print("No duplicate dependencies found.")
@@ -2,11 +2,16 @@ import argparse
 import json
 import subprocess as sp
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 import requests
-import toml
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
 ROOT_DIR = Path(__file__).absolute().parent.parent
 
@@ -17,6 +22,7 @@ parser.add_argument(
     help="Only print the crates that will be published",
 )
 args = parser.parse_args()
+session = requests.Session()
 
 
 def get_crate_index_path(crate_name: str) -> str:
@@ -33,42 +39,63 @@ def get_crate_index_path(crate_name: str) -> str:
         return f"/{first_two}/{second_two}/{crate_name}"
 
 
-def request_crate_index(crate_path: str) -> List[Any]:
-    req = requests.get(f"https://index.crates.io{crate_path}")
+def crate_index_has_version(crate_path: str, version: str) -> bool:
+    with session.get(f"https://index.crates.io{crate_path}", stream=True) as req:
+        if req.status_code == 404:
+            return False
 
-    if req.status_code == 404:
-        return []
+        # Index is json lines, one per published version
+        for line in req.iter_lines():
+            if line and json.loads(line)["vers"] == version:
+                return True
+    return False
 
-    # Return json lines
-    text_data = req.text.split("\n")
-    return [json.loads(line) for line in text_data if line]
 
+def wait_for_index(crate_name: str, version: str, timeout: float = 180, interval: float = 5) -> bool:
+    crate_path = get_crate_index_path(crate_name)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if crate_index_has_version(crate_path, version):
+            return True
+        time.sleep(interval)
+    return False
 
-def get_all_crate_members(cargo_toml: Path) -> List[str]:
-    read_data = toml.load(cargo_toml)
 
-    return read_data.get("workspace", {}).get("members", [])
+def read_manifest(cargo_toml: Path) -> Dict[str, Any]:
+    with cargo_toml.open("rb") as fp:
+        return tomllib.load(fp)
 
 
-ALL_CRATES = get_all_crate_members(ROOT_DIR / "Cargo.toml")
+WORKSPACE_MANIFEST = read_manifest(ROOT_DIR / "Cargo.toml")
+WORKSPACE_PACKAGE = WORKSPACE_MANIFEST.get("workspace", {}).get("package", {})
+ALL_CRATES: List[str] = WORKSPACE_MANIFEST.get("workspace", {}).get("members", [])
 
 print("Found:", ALL_CRATES)
 
-PUBLISH_CRATE: List[Tuple[str, str]] = []
-for crate in ALL_CRATES:
-    crate_crate_toml = ROOT_DIR / crate / "Cargo.toml"
+# Parse every member manifest once, everything below works from this cache
+CRATE_MANIFESTS = {crate: read_manifest(ROOT_DIR / crate / "Cargo.toml") for crate in ALL_CRATES}
 
-    crate_toml = toml.load(crate_crate_toml)
+CRATE_PACKAGES: List[Tuple[str, str]] = []
+for crate_toml in CRATE_MANIFESTS.values():
     package_name = crate_toml["package"]["name"]
     package_version = crate_toml["package"]["version"]
-
-    print("Fetching crate index for:", package_name)
-    crate_path = get_crate_index_path(package_name)
-    crate_index = request_crate_index(crate_path)
-
-    all_published = [x["vers"] for x in crate_index]
-
-    if package_version in all_published:
+    # version.workspace = true
+    if isinstance(package_version, dict) and package_version.get("workspace"):
+        package_version = WORKSPACE_PACKAGE["version"]
+    CRATE_PACKAGES.append((package_name, package_version))
+
+print("Fetching crate index for:", [name for name, _ in CRATE_PACKAGES])
+with ThreadPoolExecutor(max_workers=16) as executor:
+    crate_published = list(
+        executor.map(
+            lambda package: crate_index_has_version(get_crate_index_path(package[0]), package[1]),
+            CRATE_PACKAGES,
+        )
+    )
+
+PUBLISH_CRATE: List[str] = []
+for (package_name, package_version), is_published in zip(CRATE_PACKAGES, crate_published):
+    if is_published:
         print(f" Skipping {package_name} as {package_version} is already published")
     else:
         print(f" Adding {package_name} to publish list")
@@ -85,12 +112,15 @@ if "airpope-macros" in PUBLISH_CRATE:
 
 print("Publishing:", PUBLISH_CRATE)
 
-# Every 2 crates, we sleep for 3 minutes
+CRATE_VERSIONS = dict(CRATE_PACKAGES)
+
+# Wait for each crate to show up in the index (at most 3 minutes) before the next one
 if not args.dry_run:
     for i, crate in enumerate(PUBLISH_CRATE):
         print(f"Publishing {crate} ({i + 1}/{len(PUBLISH_CRATE)})")
-        if i % 2 == 0 and i != 0:
-            print(" Waiting 3 minutes...")
-            time.sleep(180)
+        sp.run(["cargo", "publish", "-p", crate], check=True)
 
-        sp.run(f"cargo publish -p {crate}", shell=True)
+        if i + 1 < len(PUBLISH_CRATE):
+            print(" Waiting for crates.io index...")
+            if not wait_for_index(crate, CRATE_VERSIONS[crate]):
+                print(" Timed out waiting for index, continuing anyway")
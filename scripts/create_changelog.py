@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import List
 
 ROOT_DIR = Path(__file__).parent.parent.absolute()
 
@@ -36,19 +37,21 @@ VERSION = GIT_TAGS.split("/")[-1]
 if VERSION.startswith("v"):
     VERSION = VERSION[1:]
 
-EXTRACTED_CHANGELOG = ""
+EXTRACTED_LINES: List[str] = []
 START = False
-for line in CHANGELOG_FILE.read_text().splitlines():
-    if line.startswith("## [") and START:
-        break
-    if line.startswith(f"## [{VERSION}]"):
-        line = INNER_DESC
-        START = True
-
-    if START:
-        EXTRACTED_CHANGELOG += line + "\n"
-
-EXTRACTED_CHANGELOG = EXTRACTED_CHANGELOG.strip()
+with CHANGELOG_FILE.open("r", encoding="utf-8") as fp:
+    for line in fp:
+        line = line.rstrip("\r\n")
+        if line.startswith("## [") and START:
+            break
+        if line.startswith(f"## [{VERSION}]"):
+            line = INNER_DESC
+            START = True
+
+        if START:
+            EXTRACTED_LINES.append(line)
+
+EXTRACTED_CHANGELOG = "\n".join(EXTRACTED_LINES).strip()
 
 # Write into CHANGELOG-GENERATED.md
 if not EXTRACTED_CHANGELOG:
@@ -1,24 +1,64 @@
 # Quick script to prepare test fixtures from JSON files.
 
 import json
+import os
 from base64 import b64encode
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, List, Optional
+
+try:
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def json_dumps(data: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+
+except ImportError:
+
+    def json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def json_dumps(data: Any, pretty: bool = False) -> bytes:
+        # Match orjson output so the fixtures are the same regardless of what is installed
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 ROOT_DIR = Path(__file__).parent.parent.absolute()
 
 ignore_folders = ["target", ".venv", ".env", "env", "DOWNLOADS", "sandbox", ".vscode", ".github"]
 
-for base_dir in ROOT_DIR.iterdir():
-    if base_dir.is_dir() and base_dir.name not in ignore_folders:
-        for json_file in base_dir.rglob("*.json"):
-            try:
-                data = json.loads(json_file.read_text())
-            except json.decoder.JSONDecodeError:
+
+def prepare_fixture(json_file: Path) -> Optional[Path]:
+    try:
+        data = json_loads(json_file.read_bytes())
+    except ValueError:
+        return None
+    # Encode
+    encoded_file = json_file.parent / f"{json_file.stem}.tmfxture"
+    encoded_file.write_bytes(b64encode(json_dumps(data)))
+    # Redump original to be pretty
+    json_file.write_bytes(json_dumps(data, pretty=True))
+    return encoded_file
+
+
+if __name__ == "__main__":
+    json_files: List[Path] = []
+    for dir_path, dir_names, file_names in os.walk(ROOT_DIR):
+        # Prune ignored folders in-place so os.walk never descends into them
+        dir_names[:] = [name for name in dir_names if name not in ignore_folders and not name.startswith(".")]
+        # Only look inside folders, not at the repository root itself
+        if dir_path == str(ROOT_DIR):
+            continue
+        json_files.extend(Path(dir_path) / name for name in file_names if name.endswith(".json"))
+
+    with ProcessPoolExecutor() as executor:
+        for json_file, encoded_file in zip(json_files, executor.map(prepare_fixture, json_files, chunksize=16)):
+            if encoded_file is None:
                 print(f"Error decoding {json_file}")
-                continue
-            # Encode
-            encoded_file = json_file.parent / f"{json_file.stem}.tmfxture"
-            encoded_file.write_bytes(b64encode(json.dumps(data).encode("utf-8")))
-            # Redump original to be pretty
-            json_file.write_text(json.dumps(data, indent=2))
-            print(f"Prepared {json_file} -> {encoded_file}")
+            else:
+                print(f"Prepared {json_file} -> {encoded_file}")
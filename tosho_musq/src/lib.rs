@@ -104,7 +104,7 @@ use tokio::io::{self, AsyncWriteExt};
 ///     println!("{:?}", manga);
 /// }
 /// ```
-#[derive(Debug)]
+#[derive(Clone, Debug)]
 pub struct MUClient {
     inner: reqwest::Client,
     secret: String,
@@ -569,7 +569,7 @@ impl MUClient {
     ///
     /// # Parameters
     /// * `url` - The URL to download the image from.
-    /// * `writer` - The writer to write the image to.
+    /// * `writer` - The writer to write the image to, flushed once the download is complete.
     pub async fn stream_download(
         &self,
         url: &str,
@@ -611,6 +611,8 @@ impl MUClient {
             let item = item.unwrap();
             writer.write_all(&item).await?;
         }
+        // make sure buffered writers are written out before returning
+        writer.flush().await?;
 
         Ok(())
     }